@@ -14,6 +14,8 @@ from app.core.config import settings
 # Import all models to ensure they're registered with Base
 from app.models.task import Task
 from app.models.reminder import Reminder
+from app.models.archive import ReminderArchive, TaskArchive
+from app.models.task_stats import TaskStatsCounter, TaskStatsState
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,28 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: 002_keyset_indexes
+Revises: 001_initial
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_keyset_indexes'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sort keys used by cursor pagination on GET /tasks and GET /reminders
+    op.create_index('ix_tasks_created_at_id', 'tasks', ['created_at', 'id'])
+    op.create_index('ix_reminders_remind_at_id', 'reminders', ['remind_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reminders_remind_at_id', table_name='reminders')
+    op.drop_index('ix_tasks_created_at_id', table_name='tasks')
@@ -0,0 +1,43 @@
+"""Add unique constraint on reminders (task_id, remind_at, channel)
+
+Revision ID: 003_reminder_dedupe
+Revises: 002_keyset_indexes
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_reminder_dedupe'
+down_revision: Union[str, None] = '002_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Remove existing duplicates, keeping the oldest row of each group
+    op.execute("""
+        DELETE FROM reminders r
+        USING reminders d
+        WHERE r.task_id = d.task_id
+          AND r.remind_at = d.remind_at
+          AND r.channel = d.channel
+          AND (r.created_at, r.id) > (d.created_at, d.id)
+    """)
+
+    op.create_unique_constraint(
+        'uq_reminders_task_id_remind_at_channel',
+        'reminders',
+        ['task_id', 'remind_at', 'channel']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'uq_reminders_task_id_remind_at_channel',
+        'reminders',
+        type_='unique'
+    )
@@ -0,0 +1,63 @@
+"""Rebuild the index set around the queries the CRUD layer runs
+
+Revision ID: 004_query_shaped_indexes
+Revises: 003_reminder_dedupe
+Create Date: 2026-10-17 11:00:00.000000
+
+Dropped:
+- ix_tasks_id, ix_reminders_id: duplicate the primary key indexes
+- ix_reminders_sent: boolean, almost no selectivity
+- ix_reminders_remind_at: prefix of ix_reminders_remind_at_id
+- ix_reminders_task_id: prefix of uq_reminders_task_id_remind_at_channel
+- ix_tasks_status: prefix of ix_tasks_status_created_at_id
+
+Added:
+- ix_reminders_due: partial (remind_at, id) WHERE NOT sent, for the
+  scheduler claim query and GET /reminders?sent=false
+- ix_tasks_status_created_at_id: GET /tasks?status=... ordered newest first
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_query_shaped_indexes'
+down_revision: Union[str, None] = '003_reminder_dedupe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_tasks_id', table_name='tasks')
+    op.drop_index('ix_tasks_status', table_name='tasks')
+    op.create_index(
+        'ix_tasks_status_created_at_id',
+        'tasks',
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+    op.drop_index('ix_reminders_id', table_name='reminders')
+    op.drop_index('ix_reminders_sent', table_name='reminders')
+    op.drop_index('ix_reminders_remind_at', table_name='reminders')
+    op.drop_index('ix_reminders_task_id', table_name='reminders')
+    op.create_index(
+        'ix_reminders_due',
+        'reminders',
+        ['remind_at', 'id'],
+        postgresql_where=sa.text('sent = false')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reminders_due', table_name='reminders')
+    op.create_index('ix_reminders_task_id', 'reminders', ['task_id'])
+    op.create_index('ix_reminders_remind_at', 'reminders', ['remind_at'])
+    op.create_index('ix_reminders_sent', 'reminders', ['sent'])
+    op.create_index('ix_reminders_id', 'reminders', ['id'])
+
+    op.drop_index('ix_tasks_status_created_at_id', table_name='tasks')
+    op.create_index('ix_tasks_status', 'tasks', ['status'])
+    op.create_index('ix_tasks_id', 'tasks', ['id'])
@@ -0,0 +1,32 @@
+"""Add recurrence columns to reminders
+
+Revision ID: 005_recurring_reminders
+Revises: 004_query_shaped_indexes
+Create Date: 2026-10-17 15:00:00.000000
+
+A recurring reminder is a single row with repeat_interval (and an
+optional repeat_until); the scheduler inserts the next occurrence when
+the current one is sent.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_recurring_reminders'
+down_revision: Union[str, None] = '004_query_shaped_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('reminders', sa.Column('repeat_interval', sa.Interval(), nullable=True))
+    op.add_column('reminders', sa.Column('repeat_until', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('reminders', 'repeat_until')
+    op.drop_column('reminders', 'repeat_interval')
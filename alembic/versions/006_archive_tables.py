@@ -0,0 +1,69 @@
+"""Add archive tables for the retention job
+
+Revision ID: 006_archive_tables
+Revises: 005_recurring_reminders
+Create Date: 2026-10-17 16:00:00.000000
+
+tasks_archive and reminders_archive mirror the live tables plus an
+archived_at column, without the foreign key, and carry the same list
+ordering indexes so ?include_archived=true can merge both sides.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_archive_tables'
+down_revision: Union[str, None] = '005_recurring_reminders'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tasks_archive',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('title', sa.String(255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(50), nullable=False),
+        sa.Column('due_time', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_tasks_archive_created_at_id', 'tasks_archive', ['created_at', 'id'])
+    op.create_index(
+        'ix_tasks_archive_status_created_at_id',
+        'tasks_archive',
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+    op.create_table(
+        'reminders_archive',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('task_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('remind_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('channel', sa.String(50), nullable=False),
+        sa.Column('sent', sa.Boolean(), nullable=False),
+        sa.Column('repeat_interval', sa.Interval(), nullable=True),
+        sa.Column('repeat_until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_reminders_archive_remind_at_id', 'reminders_archive', ['remind_at', 'id'])
+    op.create_index('ix_reminders_archive_task_id', 'reminders_archive', ['task_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reminders_archive_task_id', table_name='reminders_archive')
+    op.drop_index('ix_reminders_archive_remind_at_id', table_name='reminders_archive')
+    op.drop_table('reminders_archive')
+
+    op.drop_index('ix_tasks_archive_status_created_at_id', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_created_at_id', table_name='tasks_archive')
+    op.drop_table('tasks_archive')
@@ -0,0 +1,94 @@
+"""Partition reminders by month on remind_at
+
+Revision ID: 007_partition_reminders
+Revises: 006_archive_tables
+Create Date: 2026-10-17 17:00:00.000000
+
+reminders becomes a range-partitioned table with one partition per UTC
+month (reminders_yYYYYmMM) plus reminders_default for anything outside
+them. Partitions are created for every month from the oldest reminder to
+three months ahead; the scheduler keeps creating future ones.
+
+A primary key on a partitioned table must include the partition key, so
+it becomes (id, remind_at). The unique constraint and indexes keep their
+names. Rows are copied over, so run this during a maintenance window.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_partition_reminders'
+down_revision: Union[str, None] = '006_archive_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _add_constraints(primary_key: str) -> None:
+    op.execute(f"ALTER TABLE reminders ADD CONSTRAINT reminders_pkey PRIMARY KEY ({primary_key})")
+    op.execute(
+        "ALTER TABLE reminders ADD CONSTRAINT uq_reminders_task_id_remind_at_channel "
+        "UNIQUE (task_id, remind_at, channel)"
+    )
+    op.execute(
+        "ALTER TABLE reminders ADD CONSTRAINT reminders_task_id_fkey "
+        "FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE"
+    )
+    op.execute("CREATE INDEX ix_reminders_remind_at_id ON reminders (remind_at, id)")
+    op.execute("CREATE INDEX ix_reminders_due ON reminders (remind_at, id) WHERE sent = false")
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE reminders RENAME TO reminders_unpartitioned")
+    # Free the index names for the new table
+    op.execute("""
+        ALTER TABLE reminders_unpartitioned
+            DROP CONSTRAINT reminders_pkey,
+            DROP CONSTRAINT uq_reminders_task_id_remind_at_channel
+    """)
+    op.execute("DROP INDEX ix_reminders_remind_at_id, ix_reminders_due")
+
+    op.execute("""
+        CREATE TABLE reminders (LIKE reminders_unpartitioned INCLUDING DEFAULTS)
+        PARTITION BY RANGE (remind_at)
+    """)
+    _add_constraints("id, remind_at")
+    op.execute("CREATE TABLE reminders_default PARTITION OF reminders DEFAULT")
+
+    op.execute("""
+        DO $$
+        DECLARE
+            part_start timestamptz;
+            last_start timestamptz := date_trunc('month', now(), 'UTC') + interval '3 months';
+        BEGIN
+            -- Month arithmetic follows the session time zone
+            PERFORM set_config('TimeZone', 'UTC', true);
+            SELECT date_trunc('month', min(remind_at), 'UTC') INTO part_start FROM reminders_unpartitioned;
+            part_start := least(coalesce(part_start, last_start), date_trunc('month', now(), 'UTC'));
+            WHILE part_start <= last_start LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF reminders FOR VALUES FROM (%L) TO (%L)',
+                    'reminders_' || to_char(part_start AT TIME ZONE 'UTC', '"y"YYYY"m"MM'),
+                    part_start,
+                    part_start + interval '1 month'
+                );
+                part_start := part_start + interval '1 month';
+            END LOOP;
+        END
+        $$
+    """)
+
+    op.execute("INSERT INTO reminders SELECT * FROM reminders_unpartitioned")
+    op.execute("DROP TABLE reminders_unpartitioned")
+    op.execute("ANALYZE reminders")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE reminders RENAME TO reminders_partitioned")
+    op.execute("CREATE TABLE reminders (LIKE reminders_partitioned INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO reminders SELECT * FROM reminders_partitioned")
+    # Drops every partition along with the parent and its indexes
+    op.execute("DROP TABLE reminders_partitioned")
+    _add_constraints("id")
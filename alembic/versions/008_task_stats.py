@@ -0,0 +1,141 @@
+"""Add trigger-maintained task statistics
+
+Revision ID: 008_task_stats
+Revises: 007_partition_reminders
+Create Date: 2026-10-17 18:00:00.000000
+
+task_stats holds task counts per (status, source), plus how many of them
+are pending and overdue as of task_stats_state.overdue_as_of. Statement
+level triggers on tasks apply the net change of every INSERT, UPDATE and
+DELETE from the transition tables, so bulk inserts, COPY, cascades and
+retention moves are all counted; TRUNCATE empties task_stats. Each
+backend writes to its own shard (pg_backend_pid() % 16), so concurrent
+writers do not queue on one row.
+
+Triggers read the overdue watermark without locking it, so task writes
+never wait on the jobs that move it. A write in flight while the
+watermark moves can count a task due just before it on the wrong side;
+the periodic reconciliation corrects that drift.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_task_stats'
+down_revision: Union[str, None] = '007_partition_reminders'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Counts one row of a transition table as overdue
+_OVERDUE = "coalesce(status = 'PENDING' AND due_time < as_of, false)::int"
+
+
+def _apply(deltas: str) -> str:
+    """Upsert the per-(status, source) sums of ``deltas`` into this backend's shard."""
+    return f"""
+        INSERT INTO task_stats AS s (status, source, shard, total, overdue)
+        SELECT status, source, pg_backend_pid() % 16, sum(total), sum(overdue)
+        FROM ({deltas}) AS delta
+        GROUP BY status, source
+        HAVING sum(total) <> 0 OR sum(overdue) <> 0
+        ON CONFLICT (status, source, shard) DO UPDATE
+        SET total = s.total + EXCLUDED.total, overdue = s.overdue + EXCLUDED.overdue;
+    """
+
+
+_ADDED = f"SELECT status, source, 1 AS total, {_OVERDUE} AS overdue FROM new_rows"
+_REMOVED = f"SELECT status, source, -1 AS total, -{_OVERDUE} AS overdue FROM old_rows"
+
+
+def upgrade() -> None:
+    op.create_table(
+        'task_stats',
+        sa.Column('status', sa.String(50), primary_key=True),
+        sa.Column('source', sa.String(50), primary_key=True),
+        sa.Column('shard', sa.SmallInteger(), primary_key=True),
+        sa.Column('total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('overdue', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    op.create_table(
+        'task_stats_state',
+        sa.Column('id', sa.SmallInteger(), primary_key=True),
+        sa.Column('overdue_as_of', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('reconciled_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint('id = 1', name='ck_task_stats_state_single_row'),
+    )
+
+    op.execute(f"""
+        CREATE FUNCTION task_stats_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            as_of timestamptz;
+        BEGIN
+            SELECT overdue_as_of INTO as_of FROM task_stats_state WHERE id = 1;
+            IF TG_OP = 'INSERT' THEN
+                {_apply(_ADDED)}
+            ELSIF TG_OP = 'DELETE' THEN
+                {_apply(_REMOVED)}
+            ELSE
+                {_apply(f"{_ADDED} UNION ALL {_REMOVED}")}
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    # Transition tables are only allowed on single-event triggers
+    op.execute("""
+        CREATE TRIGGER task_stats_insert AFTER INSERT ON tasks
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION task_stats_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER task_stats_update AFTER UPDATE ON tasks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION task_stats_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER task_stats_delete AFTER DELETE ON tasks
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION task_stats_apply()
+    """)
+
+    # TRUNCATE removes every task, so the counts all drop to zero
+    op.execute("""
+        CREATE FUNCTION task_stats_truncate() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM task_stats;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER task_stats_truncate AFTER TRUNCATE ON tasks
+        FOR EACH STATEMENT EXECUTE FUNCTION task_stats_truncate()
+    """)
+
+    # Initial counts; the table is locked so no write slips in between
+    op.execute("LOCK TABLE tasks IN SHARE MODE")
+    op.execute("INSERT INTO task_stats_state (id, overdue_as_of, reconciled_at) VALUES (1, now(), now())")
+    op.execute("""
+        INSERT INTO task_stats (status, source, shard, total, overdue)
+        SELECT status, source, 0, count(*), count(*) FILTER (WHERE status = 'PENDING' AND due_time < now())
+        FROM tasks
+        GROUP BY status, source
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER task_stats_truncate ON tasks")
+    op.execute("DROP FUNCTION task_stats_truncate()")
+    op.execute("DROP TRIGGER task_stats_delete ON tasks")
+    op.execute("DROP TRIGGER task_stats_update ON tasks")
+    op.execute("DROP TRIGGER task_stats_insert ON tasks")
+    op.execute("DROP FUNCTION task_stats_apply()")
+    op.drop_table('task_stats_state')
+    op.drop_table('task_stats')
@@ -0,0 +1,44 @@
+"""Add a full-text search column on tasks
+
+Revision ID: 009_task_search
+Revises: 008_task_stats
+Create Date: 2026-10-17 19:00:00.000000
+
+search_vector is a stored generated tsvector over title (weight A) and
+description (weight B), indexed with GIN for GET /tasks/search. Adding
+it rewrites the tasks table.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_task_search'
+down_revision: Union[str, None] = '008_task_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'tasks',
+        sa.Column(
+            'search_vector',
+            TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True
+            )
+        )
+    )
+    op.create_index('ix_tasks_search_vector', 'tasks', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_search_vector', table_name='tasks')
+    op.drop_column('tasks', 'search_vector')
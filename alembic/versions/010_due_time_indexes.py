@@ -0,0 +1,44 @@
+"""Index tasks for due-time windows and overdue queries
+
+Revision ID: 010_due_time_indexes
+Revises: 009_task_search
+Create Date: 2026-10-17 20:00:00.000000
+
+Dropped:
+- ix_tasks_due_time: prefix of ix_tasks_due_time_id
+
+Added:
+- ix_tasks_due_time_id: GET /tasks?due_after=...&due_before=... and
+  sort=due_time, with id as the keyset tie-breaker
+- ix_tasks_status_due_time_id: the same per status, including
+  overdue=true (pending and due before now) and the overdue counts of
+  the task stats jobs
+
+The indexes are not covering: GET /tasks returns every task column, so
+list queries still fetch the matching rows from the heap. What the
+indexes give them is a scan bounded to the requested window, already in
+(due_time, id) order, so no sort is needed.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_due_time_indexes'
+down_revision: Union[str, None] = '009_task_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_tasks_due_time', table_name='tasks')
+    op.create_index('ix_tasks_due_time_id', 'tasks', ['due_time', 'id'])
+    op.create_index('ix_tasks_status_due_time_id', 'tasks', ['status', 'due_time', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_status_due_time_id', table_name='tasks')
+    op.drop_index('ix_tasks_due_time_id', table_name='tasks')
+    op.create_index('ix_tasks_due_time', 'tasks', ['due_time'])
@@ -0,0 +1,35 @@
+"""Add a claim lease to reminders
+
+Revision ID: 011_reminder_claim_lease
+Revises: 010_due_time_indexes
+Create Date: 2026-10-17 21:00:00.000000
+
+The scheduler claims a batch of due reminders by setting claimed_until
+and commits before sending, so no row lock or transaction is held while
+notifications go out. Other workers skip the batch until the lease
+expires; a reminder whose lease ran out unsent (crashed worker, failed
+delivery) is claimable again. The archive gets the column too, since it
+mirrors the live table.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_reminder_claim_lease'
+down_revision: Union[str, None] = '010_due_time_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('reminders', sa.Column('claimed_until', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('reminders_archive', sa.Column('claimed_until', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('reminders_archive', 'claimed_until')
+    op.drop_column('reminders', 'claimed_until')
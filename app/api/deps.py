@@ -1,8 +1,15 @@
+from datetime import datetime
 from typing import AsyncGenerator
+from uuid import UUID
 
+from fastapi import HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
+from app.core.pagination import decode_cursor
+from app.schemas.task import TaskSort
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -18,3 +25,97 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+
+def get_cursor(
+    after: str | None = Query(
+        None,
+        description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+    )
+) -> tuple[datetime, UUID] | None:
+    """
+    FastAPI dependency that decodes the keyset pagination cursor.
+
+    Args:
+        after: Opaque cursor string
+
+    Returns:
+        Decoded (sort key, id) tuple or None if no cursor was given
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    if after is None:
+        return None
+    try:
+        return decode_cursor(after)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def get_rank_cursor(
+    after: str | None = Query(
+        None,
+        description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+    )
+) -> tuple[float, UUID] | None:
+    """
+    FastAPI dependency that decodes a cursor of results ordered by rank.
+
+    Args:
+        after: Opaque cursor string
+
+    Returns:
+        Decoded (rank, id) tuple or None if no cursor was given
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    if after is None:
+        return None
+    try:
+        return decode_cursor(after, key_type=float)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def get_task_cursor(
+    sort: TaskSort = Query(
+        TaskSort.CREATED_AT,
+        description="created_at: newest first; due_time: soonest due first, tasks without a due time left out"
+    ),
+    after: str | None = Query(
+        None,
+        description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+    )
+) -> tuple[datetime, UUID] | None:
+    """
+    FastAPI dependency that decodes the cursor of a task list in the requested sort order.
+
+    Cursors carry the sort order they were issued for, so a page can only
+    be continued in the same order.
+
+    Args:
+        sort: Sort order of the list
+        after: Opaque cursor string
+
+    Returns:
+        Decoded (sort key, id) tuple or None if no cursor was given
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or from another sort order
+    """
+    if after is None:
+        return None
+    try:
+        return decode_cursor(after, sort=None if sort is TaskSort.CREATED_AT else sort.value)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
@@ -1,16 +1,50 @@
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import NEXT_CURSOR_HEADER, get_cursor, get_db
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.pagination import encode_cursor
+from app.core.serialization import NDJSON_MEDIA_TYPE, encode_ndjson, json_response
 from app.crud import reminder as crud_reminder
 from app.crud import task as crud_task
-from app.schemas.reminder import Reminder, ReminderCreate
+from app.schemas.reminder import (
+    Reminder,
+    ReminderBatchGet,
+    ReminderBatchGetResult,
+    ReminderBulkItem,
+    ReminderBulkResult,
+    ReminderBulkStatus,
+    ReminderCreate,
+)
+from app.services.scheduler import reminder_scheduler
 
 router = APIRouter()
 
+# Unique constraint reported as a 409 duplicate. Violations name the
+# partition's copy of it, e.g. reminders_y2026m10_task_id_remind_at_channel_key
+DUPLICATE_CONSTRAINT = "uq_reminders_task_id_remind_at_channel"
+DUPLICATE_PARTITION_CONSTRAINT_SUFFIX = "_task_id_remind_at_channel_key"
+# SQLSTATE of a foreign key violation: the task was deleted concurrently
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _is_duplicate(exc: IntegrityError) -> bool:
+    """Whether the error is a violation of DUPLICATE_CONSTRAINT."""
+    name = getattr(exc.orig.__cause__, "constraint_name", None) or ""
+    return name == DUPLICATE_CONSTRAINT or name.endswith(DUPLICATE_PARTITION_CONSTRAINT_SUFFIX)
+
+
+def _is_missing_task(exc: IntegrityError) -> bool:
+    """Whether the error is a violation of the reminders -> tasks foreign key."""
+    return getattr(exc.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION
+
 
 @router.post("/", response_model=Reminder, status_code=status.HTTP_201_CREATED)
 async def create_reminder(
@@ -29,6 +63,7 @@ async def create_reminder(
 
     Raises:
         HTTPException: 404 if associated task not found
+        HTTPException: 409 if an identical reminder already exists
     """
     # Verify task exists
     task = await crud_task.get_task(db=db, task_id=reminder_in.task_id)
@@ -38,26 +73,171 @@ async def create_reminder(
             detail=f"Task with id {reminder_in.task_id} not found"
         )
 
-    reminder = await crud_reminder.create_reminder(db=db, reminder_in=reminder_in)
+    try:
+        reminder = await crud_reminder.create_reminder(db=db, reminder_in=reminder_in)
+    except IntegrityError as exc:
+        await db.rollback()
+        if _is_duplicate(exc):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A reminder for this task, time and channel already exists"
+            )
+        if _is_missing_task(exc):
+            # Deleted between the check above and the insert
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Task with id {reminder_in.task_id} not found"
+            )
+        raise
+    reminder_scheduler.reminders_scheduled([reminder.remind_at])
     return reminder
 
 
+@router.post("/bulk", response_model=ReminderBulkResult, status_code=status.HTTP_201_CREATED)
+async def create_reminders_bulk(
+    reminders_in: List[ReminderCreate],
+    db: AsyncSession = Depends(get_db)
+) -> ReminderBulkResult:
+    """
+    Create many reminders in one call.
+
+    Parent tasks are validated with a single query and all reminders are
+    inserted in one transaction. Items whose task does not exist are
+    reported as ``task_not_found``, including tasks deleted while the
+    call runs; items matching an existing reminder
+    (same task, time and channel) are reported as ``duplicate`` and are
+    not inserted again. At most BULK_MAX_ITEMS (default 5000) reminders
+    are accepted per call.
+
+    Args:
+        reminders_in: List of reminder creation data
+        db: Database session
+
+    Returns:
+        Per-status counts and one result per item, in request order
+
+    Raises:
+        HTTPException: 413 if the batch exceeds BULK_MAX_ITEMS
+    """
+    if len(reminders_in) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BULK_MAX_ITEMS} reminders can be created per call"
+        )
+
+    while True:
+        existing_task_ids = await crud_task.get_existing_task_ids(
+            db=db,
+            task_ids=[reminder_in.task_id for reminder_in in reminders_in]
+        ) if reminders_in else set()
+
+        valid = [
+            (index, reminder_in)
+            for index, reminder_in in enumerate(reminders_in)
+            if reminder_in.task_id in existing_task_ids
+        ]
+        try:
+            created = await crud_reminder.create_reminders(
+                db=db,
+                reminders_in=[reminder_in for _, reminder_in in valid]
+            ) if valid else []
+            break
+        except IntegrityError as exc:
+            await db.rollback()
+            if not _is_missing_task(exc):
+                raise
+            # A task was deleted after the check; check again without it
+
+    items = [
+        ReminderBulkItem(index=index, status=ReminderBulkStatus.TASK_NOT_FOUND)
+        for index, reminder_in in enumerate(reminders_in)
+        if reminder_in.task_id not in existing_task_ids
+    ]
+    for (index, _), reminder in zip(valid, created):
+        if reminder is None:
+            items.append(ReminderBulkItem(index=index, status=ReminderBulkStatus.DUPLICATE))
+        else:
+            items.append(ReminderBulkItem(
+                index=index,
+                status=ReminderBulkStatus.CREATED,
+                reminder=Reminder.model_validate(reminder)
+            ))
+    items.sort(key=lambda item: item.index)
+    reminder_scheduler.reminders_scheduled(
+        reminder.remind_at for reminder in created if reminder is not None
+    )
+
+    created_count = sum(1 for reminder in created if reminder is not None)
+    return ReminderBulkResult(
+        created=created_count,
+        duplicates=len(created) - created_count,
+        task_not_found=len(reminders_in) - len(valid),
+        items=items
+    )
+
+
+@router.post("/batch-get", response_model=ReminderBatchGetResult)
+async def batch_get_reminders(
+    request: ReminderBatchGet,
+    db: AsyncSession = Depends(get_db)
+) -> Response:
+    """
+    Fetch many reminders by ID in one call.
+
+    All IDs are resolved with a single query. Found reminders are returned
+    in request order, each once; IDs that do not exist are listed in
+    ``missing``. At most BATCH_GET_MAX_IDS (default 1000) IDs are
+    accepted per call.
+
+    Args:
+        request: IDs of the reminders to fetch
+        db: Database session
+
+    Returns:
+        Found reminders and missing IDs, in request order
+
+    Raises:
+        HTTPException: 413 if more than BATCH_GET_MAX_IDS IDs are given
+    """
+    if len(request.ids) > settings.BATCH_GET_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BATCH_GET_MAX_IDS} reminders can be fetched per call"
+        )
+
+    ids = list(dict.fromkeys(request.ids))
+    found = await crud_reminder.get_reminders_by_ids(db=db, reminder_ids=ids) if ids else {}
+    return json_response({
+        "items": [found[reminder_id] for reminder_id in ids if reminder_id in found],
+        "missing": [reminder_id for reminder_id in ids if reminder_id not in found],
+    })
+
+
 @router.get("/", response_model=List[Reminder])
 async def get_reminders(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     task_id: UUID | None = Query(None),
     sent: bool | None = Query(None),
+    include_archived: bool = Query(False, description="Also list reminders moved to the archive"),
+    after: tuple[datetime, UUID] | None = Depends(get_cursor),
     db: AsyncSession = Depends(get_db)
-) -> List[Reminder]:
+) -> Response:
     """
     Retrieve reminders with optional filtering.
 
+    When a full page is returned, the cursor for the next page is sent in
+    the X-Next-Cursor header. Pass it back as ``after`` to continue.
+    Rows are encoded with orjson directly, without response_model
+    validation.
+
     Args:
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when ``after`` is set)
         limit: Maximum number of records to return
         task_id: Optional task ID filter
         sent: Optional sent status filter
+        include_archived: Also list archived reminders
+        after: Decoded cursor of the previous page
         db: Database session
 
     Returns:
@@ -68,9 +248,53 @@ async def get_reminders(
         skip=skip,
         limit=limit,
         task_id=task_id,
-        sent=sent
+        sent=sent,
+        after=after,
+        include_archived=include_archived
     )
-    return list(reminders)
+    headers = {}
+    if len(reminders) == limit:
+        last = reminders[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last["remind_at"], last["id"])
+    return json_response(reminders, headers=headers)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_reminders(
+    task_id: UUID | None = Query(None),
+    sent: bool | None = Query(None),
+    remind_after: datetime | None = Query(None, description="Only reminders due at or after this time"),
+    remind_before: datetime | None = Query(None, description="Only reminders due before this time")
+) -> StreamingResponse:
+    """
+    Export all matching reminders as newline-delimited JSON.
+
+    Rows are read through a server-side cursor and streamed as they
+    arrive, so memory use does not grow with the table size. Reminders
+    are ordered by (remind_at, id).
+
+    Args:
+        task_id: Optional task ID filter
+        sent: Optional sent status filter
+        remind_after: Optional lower bound on remind_at
+        remind_before: Optional upper bound on remind_at
+
+    Returns:
+        Streaming NDJSON response, one reminder per line
+    """
+    async def lines() -> AsyncIterator[bytes]:
+        # Own session: the body is streamed after the endpoint has returned
+        async with AsyncSessionLocal() as db:
+            async for reminders in crud_reminder.stream_reminders(
+                db=db,
+                task_id=task_id,
+                sent=sent,
+                remind_after=remind_after,
+                remind_before=remind_before
+            ):
+                yield encode_ndjson(reminders)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
 
 
 @router.delete("/{reminder_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -94,4 +318,5 @@ async def delete_reminder(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Reminder with id {reminder_id} not found"
         )
+    reminder_scheduler.invalidate()
 
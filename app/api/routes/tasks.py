@@ -1,16 +1,53 @@
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import NEXT_CURSOR_HEADER, get_db, get_rank_cursor, get_task_cursor
+from app.core.cache import task_cache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.pagination import encode_cursor
+from app.core.serialization import NDJSON_MEDIA_TYPE, encode_ndjson, json_response
+from app.crud import reminder as crud_reminder
 from app.crud import task as crud_task
-from app.schemas.task import Task, TaskCreate, TaskUpdate
+from app.crud import task_stats as crud_task_stats
+from app.schemas.task import (
+    Task,
+    TaskBatchGet,
+    TaskBatchGetResult,
+    TaskBulkItem,
+    TaskBulkResult,
+    TaskCreate,
+    TaskInclude,
+    TaskSearchResult,
+    TaskSort,
+    TaskStats,
+    TaskUpdate,
+    TaskWithReminders,
+)
 from app.models.task import TaskStatus
+from app.services.scheduler import reminder_scheduler
 
 router = APIRouter()
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_INCLUDE_DESCRIPTION = "Embed related objects: 'reminders' nests each task's reminders"
+
+
+def _task_etag(task: Task) -> str:
+    """Build the ETag of a task from its last update time."""
+    return f'"{(task.updated_at - _EPOCH) // timedelta(microseconds=1):x}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    candidates = [value.strip().removeprefix("W/") for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
 
 @router.post("/", response_model=Task, status_code=status.HTTP_201_CREATED)
 async def create_task(
@@ -31,20 +68,120 @@ async def create_task(
     return task
 
 
-@router.get("/", response_model=List[Task])
+@router.post("/bulk", response_model=TaskBulkResult, status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    tasks_in: List[TaskCreate],
+    db: AsyncSession = Depends(get_db)
+) -> TaskBulkResult:
+    """
+    Create many tasks in one call.
+
+    All tasks are inserted in a single transaction: either every item is
+    created or none is. At most BULK_MAX_ITEMS (default 5000) tasks are
+    accepted per call.
+
+    Args:
+        tasks_in: List of task creation data
+        db: Database session
+
+    Returns:
+        Number of created tasks and one result per item, in request order
+
+    Raises:
+        HTTPException: 413 if the batch exceeds BULK_MAX_ITEMS
+    """
+    if len(tasks_in) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BULK_MAX_ITEMS} tasks can be created per call"
+        )
+
+    tasks = await crud_task.create_tasks(db=db, tasks_in=tasks_in) if tasks_in else []
+    return TaskBulkResult(
+        created=len(tasks),
+        items=[
+            TaskBulkItem(index=index, task=Task.model_validate(task))
+            for index, task in enumerate(tasks)
+        ]
+    )
+
+
+@router.post("/batch-get", response_model=TaskBatchGetResult)
+async def batch_get_tasks(
+    request: TaskBatchGet,
+    db: AsyncSession = Depends(get_db)
+) -> Response:
+    """
+    Fetch many tasks by ID in one call.
+
+    All IDs are resolved with a single query. Found tasks are returned
+    in request order, each once; IDs that do not exist are listed in
+    ``missing``. At most BATCH_GET_MAX_IDS (default 1000) IDs are
+    accepted per call.
+
+    Args:
+        request: IDs of the tasks to fetch
+        db: Database session
+
+    Returns:
+        Found tasks and missing IDs, in request order
+
+    Raises:
+        HTTPException: 413 if more than BATCH_GET_MAX_IDS IDs are given
+    """
+    if len(request.ids) > settings.BATCH_GET_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BATCH_GET_MAX_IDS} tasks can be fetched per call"
+        )
+
+    ids = list(dict.fromkeys(request.ids))
+    found = await crud_task.get_tasks_by_ids(db=db, task_ids=ids) if ids else {}
+    return json_response({
+        "items": [found[task_id] for task_id in ids if task_id in found],
+        "missing": [task_id for task_id in ids if task_id not in found],
+    })
+
+
+@router.get("/", response_model=Union[List[Task], List[TaskWithReminders]])
 async def get_tasks(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: TaskStatus | None = Query(None),
+    include_archived: bool = Query(False, description="Also list tasks moved to the archive"),
+    due_after: datetime | None = Query(None, description="Only tasks due at or after this time"),
+    due_before: datetime | None = Query(None, description="Only tasks due before this time"),
+    overdue: bool = Query(False, description="Only pending tasks whose due time has passed"),
+    # Documented on get_task_cursor, which reads it too
+    sort: TaskSort = Query(TaskSort.CREATED_AT),
+    include: TaskInclude | None = Query(None, description=_INCLUDE_DESCRIPTION),
+    after: tuple[datetime, UUID] | None = Depends(get_task_cursor),
     db: AsyncSession = Depends(get_db)
-) -> List[Task]:
+) -> Response:
     """
     Retrieve tasks with optional filtering.
 
+    When a full page is returned, the cursor for the next page is sent in
+    the X-Next-Cursor header. Pass it back as ``after`` with the same
+    ``sort`` to continue; this keyset mode should be preferred over
+    ``skip`` for deep pages.
+
+    Rows are fetched as plain columns and encoded with orjson directly,
+    skipping per-row ORM loading and response_model validation. With
+    ``include=reminders``, the reminders of the whole page are loaded
+    with one extra query and nested in each task.
+
     Args:
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when ``after`` is set)
         limit: Maximum number of records to return
         status: Optional status filter
+        include_archived: Also list archived tasks
+        due_after: Optional lower bound on due_time (inclusive)
+        due_before: Optional upper bound on due_time (exclusive)
+        overdue: Only pending tasks whose due time has passed
+        sort: Sort order
+        include: Optional related objects to embed
+        after: Decoded cursor of the previous page
         db: Database session
 
     Returns:
@@ -54,21 +191,153 @@ async def get_tasks(
         db=db,
         skip=skip,
         limit=limit,
-        status=status
+        status=status,
+        after=after,
+        include_archived=include_archived,
+        due_after=due_after,
+        due_before=due_before,
+        overdue=overdue,
+        sort=sort
+    )
+    if include is TaskInclude.REMINDERS:
+        reminders = await crud_reminder.get_reminders_by_task(
+            db=db,
+            task_ids=[task["id"] for task in tasks],
+            include_archived=include_archived
+        )
+        for task in tasks:
+            task["reminders"] = reminders[task["id"]]
+    headers = {}
+    if len(tasks) == limit:
+        last = tasks[-1]
+        if sort is TaskSort.DUE_TIME:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(last["due_time"], last["id"], sort=sort.value)
+        else:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(last["created_at"], last["id"])
+    return json_response(tasks, headers=headers)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    status: TaskStatus | None = Query(None),
+    created_after: datetime | None = Query(None, description="Only tasks created at or after this time"),
+    created_before: datetime | None = Query(None, description="Only tasks created before this time")
+) -> StreamingResponse:
+    """
+    Export all matching tasks as newline-delimited JSON.
+
+    Rows are read through a server-side cursor and streamed as they
+    arrive, so memory use does not grow with the table size. Tasks are
+    ordered by (created_at, id).
+
+    Args:
+        status: Optional status filter
+        created_after: Optional lower bound on created_at
+        created_before: Optional upper bound on created_at
+
+    Returns:
+        Streaming NDJSON response, one task per line
+    """
+    async def lines() -> AsyncIterator[bytes]:
+        # Own session: the body is streamed after the endpoint has returned
+        async with AsyncSessionLocal() as db:
+            async for tasks in crud_task.stream_tasks(
+                db=db,
+                status=status,
+                created_after=created_after,
+                created_before=created_before
+            ):
+                yield encode_ndjson(tasks)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get("/search", response_model=List[TaskSearchResult])
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms (web search syntax)"),
+    limit: int = Query(100, ge=1, le=1000),
+    status: TaskStatus | None = Query(None),
+    after: tuple[float, UUID] | None = Depends(get_rank_cursor),
+    db: AsyncSession = Depends(get_db)
+) -> Response:
+    """
+    Search tasks by title and description, most relevant first.
+
+    When a full page is returned, the cursor for the next page is sent in
+    the X-Next-Cursor header; pass it back as ``after`` to continue.
+
+    Args:
+        q: Search terms
+        limit: Maximum number of records to return
+        status: Optional status filter
+        after: Decoded cursor of the previous page
+        db: Database session
+
+    Returns:
+        List of matching tasks with their rank
+    """
+    tasks = await crud_task.search_tasks(
+        db=db,
+        query=q,
+        limit=limit,
+        status=status,
+        after=after
     )
-    return list(tasks)
+    headers = {}
+    if len(tasks) == limit:
+        last = tasks[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last["rank"], last["id"])
+    return json_response(tasks, headers=headers)
+
+
+@router.get("/stats", response_model=TaskStats)
+async def get_task_stats(
+    db: AsyncSession = Depends(get_db)
+) -> dict:
+    """
+    Get task counts per status and source, and how many pending tasks are overdue.
+
+    Served from the trigger-maintained task_stats table, so the cost
+    does not grow with the number of tasks. Archived tasks are not
+    counted.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Task statistics
+    """
+    return await crud_task_stats.get_task_stats(db)
 
 
-@router.get("/{task_id}", response_model=Task)
+@router.get("/{task_id}", response_model=Union[TaskWithReminders, Task])
 async def get_task(
     task_id: UUID,
+    response: Response,
+    include: TaskInclude | None = Query(None, description=_INCLUDE_DESCRIPTION),
+    if_none_match: str | None = Header(None),
     db: AsyncSession = Depends(get_db)
 ) -> Task:
     """
     Retrieve a specific task by ID.
 
+    Served from an in-process read-through cache when possible. The
+    response carries an ETag derived from ``updated_at``; clients that
+    send it back in If-None-Match get 304 Not Modified without a body.
+    Updates and deletes through this worker invalidate the entry, and a
+    read racing with them is not cached. Other workers, and tasks moved
+    out by the retention job, can serve the old task for up to
+    TASK_CACHE_TTL_SECONDS.
+
+    With ``include=reminders``, the task is read from the database with
+    its reminders, bypassing the cache; no ETag is sent, since reminder
+    changes do not touch the task's ``updated_at``.
+
     Args:
         task_id: Task UUID
+        response: Outgoing response, used to set the ETag header
+        include: Optional related objects to embed
+        if_none_match: Optional If-None-Match request header
         db: Database session
 
     Returns:
@@ -77,12 +346,25 @@ async def get_task(
     Raises:
         HTTPException: 404 if task not found
     """
-    task = await crud_task.get_task(db=db, task_id=task_id)
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id {task_id} not found"
-        )
+    with_reminders = include is TaskInclude.REMINDERS
+    task = None if with_reminders else task_cache.get(task_id)
+    if task is None:
+        generation = task_cache.generation()
+        db_task = await crud_task.get_task(db=db, task_id=task_id, with_reminders=with_reminders)
+        if not db_task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Task with id {task_id} not found"
+            )
+        if with_reminders:
+            return TaskWithReminders.model_validate(db_task)
+        task = Task.model_validate(db_task)
+        task_cache.set(task_id, task, generation=generation)
+
+    etag = _task_etag(task)
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return task
 
 
@@ -111,6 +393,7 @@ async def update_task(
         task_id=task_id,
         task_update=task_update
     )
+    task_cache.invalidate(task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -135,9 +418,12 @@ async def delete_task(
         HTTPException: 404 if task not found
     """
     deleted = await crud_task.delete_task(db=db, task_id=task_id)
+    task_cache.invalidate(task_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
+    # The task's reminders were deleted with it
+    reminder_scheduler.invalidate()
 
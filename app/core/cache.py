@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, TypeVar
+
+from app.core.config import settings
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """
+    In-process LRU cache with a size bound and a per-entry TTL.
+
+    Entries are evicted when the cache is full (least recently used
+    first) or once they are older than ``ttl`` seconds. Hit and miss
+    counters are kept so the cache can be sized from live traffic.
+
+    A read-through caller takes ``generation()`` before loading a value
+    and passes it to ``set``. If the key was invalidated in between, the
+    value may predate the write and is not stored.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        # Generation of the latest invalidation of recently invalidated keys;
+        # older records are forgotten, and sets taken before them rejected
+        self._generation = 0
+        self._invalidated: OrderedDict[Hashable, int] = OrderedDict()
+        self._forgotten = 0
+
+    def get(self, key: Hashable) -> V | None:
+        """
+        Return the cached value for ``key``, or None on a miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def generation(self) -> int:
+        """Return a token to pass to ``set`` for a value about to be loaded."""
+        return self._generation
+
+    def set(self, key: Hashable, value: V, generation: int | None = None) -> None:
+        """
+        Store ``value`` under ``key``, evicting the oldest entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            generation: Token from ``generation()`` taken before ``value``
+                was loaded; the value is dropped if ``key`` was invalidated
+                since
+        """
+        if generation is not None and (
+            generation < self._forgotten or self._invalidated.get(key, 0) > generation
+        ):
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache and reject pending sets of it."""
+        self._entries.pop(key, None)
+        self._generation += 1
+        self._invalidated[key] = self._generation
+        self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self.max_size:
+            self._forgotten = self._invalidated.popitem(last=False)[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+# Read-through cache for GET /tasks/{task_id}, keyed by task UUID
+task_cache: LRUCache = LRUCache(
+    max_size=settings.TASK_CACHE_MAX_SIZE,
+    ttl=settings.TASK_CACHE_TTL_SECONDS
+)
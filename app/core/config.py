@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,11 +10,85 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str
 
+    # Connection pool and driver settings
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    # asyncpg per-statement timeout in seconds (None disables it)
+    DB_COMMAND_TIMEOUT: Optional[float] = None
+    # asyncpg ssl mode; empty disables TLS (e.g. local databases)
+    DB_SSL: str = "require"
+    # SQL echo; defaults to on in development only
+    DB_ECHO: Optional[bool] = None
+
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    # Number of uvicorn worker processes; uvicorn reads the same variable as
+    # the default for --workers. Notification rate limits are split across them
+    WEB_CONCURRENCY: int = 1
 
     LOG_LEVEL: str = "INFO"
 
+    # Requests above these limits are logged with their statements
+    SLOW_REQUEST_MAX_QUERIES: int = 10
+    SLOW_REQUEST_MS: float = 500.0
+    # Same statement repeated this often in one request is flagged as N+1
+    N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Maximum number of items accepted by a single bulk endpoint call
+    BULK_MAX_ITEMS: int = 5000
+    # Maximum number of IDs accepted by a single batch-get call
+    BATCH_GET_MAX_IDS: int = 1000
+
+    # Number of due reminders each scheduler worker claims per batch
+    REMINDER_BATCH_SIZE: int = 100
+    # How far ahead the scheduler loads upcoming reminders into memory
+    REMINDER_WINDOW_SECONDS: int = 600
+    # Maximum number of upcoming reminder times held in memory
+    REMINDER_WINDOW_MAX_ITEMS: int = 1000
+    # Delay before reminders whose delivery failed are tried again
+    REMINDER_RETRY_SECONDS: int = 30
+    # How long a claimed batch is reserved for the worker sending it; must
+    # comfortably exceed the time to send one batch at the channel rate
+    REMINDER_CLAIM_LEASE_SECONDS: int = 300
+    # Backlog left by downtime: reminders more than REMINDER_STALE_AFTER_HOURS
+    # late are sent anyway ("send"), dropped ("skip"), or dropped unless they
+    # are the latest due one for their task and channel ("coalesce")
+    REMINDER_STALE_POLICY: Literal["send", "skip", "coalesce"] = "send"
+    REMINDER_STALE_AFTER_HOURS: float = 24.0
+    # Monthly reminders partitions the scheduler keeps created ahead of time
+    REMINDER_PARTITION_MONTHS_AHEAD: int = 3
+
+    # Retention: sent reminders and completed/cancelled tasks older than
+    # RETENTION_DAYS are moved to the archive tables ("archive"), deleted
+    # ("delete"), or kept forever ("off")
+    RETENTION_MODE: Literal["off", "archive", "delete"] = "off"
+    RETENTION_DAYS: int = 90
+    # Rows moved per transaction, to keep lock times short
+    RETENTION_BATCH_SIZE: int = 1000
+    RETENTION_INTERVAL_SECONDS: int = 3600
+
+    # GET /tasks/stats: how often the overdue watermark moves (the endpoint
+    # counts tasks past it live) and how often counts are recounted from tasks
+    TASK_STATS_OVERDUE_INTERVAL_SECONDS: int = 60
+    TASK_STATS_RECONCILE_INTERVAL_SECONDS: int = 3600
+
+    # Notification dispatch: "log" only logs, "stub" simulates a remote API
+    NOTIFICATION_SENDER: Literal["log", "stub"] = "log"
+    NOTIFICATION_STUB_LATENCY_MS: int = 50
+    NOTIFICATION_WORKERS_PER_CHANNEL: int = 8
+    # Messages per second, per channel, for all workers together
+    TELEGRAM_RATE_LIMIT: float = 30.0
+    WHATSAPP_RATE_LIMIT: float = 20.0
+    UI_RATE_LIMIT: float = 200.0
+
+    # In-process cache for GET /tasks/{task_id}. Each worker has its own
+    # cache, so the TTL bounds how stale another worker's copy can be.
+    TASK_CACHE_MAX_SIZE: int = 1024
+    TASK_CACHE_TTL_SECONDS: float = 5.0
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -1,10 +1,12 @@
-from typing import AsyncGenerator
+import time
+from typing import Any, AsyncGenerator
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
@@ -14,12 +16,56 @@ class Base(DeclarativeBase):
     pass
 
 
+class PoolWaitStats:
+    """Running totals of the time spent waiting for a pooled connection."""
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.acquisitions += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+pool_wait_stats = PoolWaitStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_stats.record(time.perf_counter() - start)
+
+
+def _connect_args() -> dict[str, Any]:
+    """Build asyncpg connect arguments from settings."""
+    connect_args: dict[str, Any] = {}
+    if settings.DB_SSL:
+        connect_args["ssl"] = settings.DB_SSL
+    if settings.DB_COMMAND_TIMEOUT is not None:
+        connect_args["command_timeout"] = settings.DB_COMMAND_TIMEOUT
+    return connect_args
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.APP_ENV == "development",
+    echo=settings.DB_ECHO if settings.DB_ECHO is not None else settings.APP_ENV == "development",
     future=True,
-    connect_args={"ssl": "require"}
+    poolclass=InstrumentedPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=_connect_args()
 )
 
 # Create async session factory
@@ -32,6 +78,28 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def get_pool_status() -> dict[str, Any]:
+    """
+    Report connection pool usage.
+
+    Returns:
+        Checked-out, idle and overflow connection counts plus the wait
+        time to acquire a connection
+    """
+    pool = engine.pool
+    acquisitions = pool_wait_stats.acquisitions
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "acquisitions": acquisitions,
+        "avg_wait_ms": round(pool_wait_stats.total_wait / acquisitions * 1000, 3) if acquisitions else 0.0,
+        "max_wait_ms": round(pool_wait_stats.max_wait * 1000, 3),
+    }
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides async database session.
@@ -42,4 +110,3 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
-
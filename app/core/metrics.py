@@ -0,0 +1,144 @@
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Latency histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Series:
+    """Counters of one (route, method, status) label set."""
+
+    __slots__ = ("bucket_counts", "total", "count")
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+
+class HTTPMetrics:
+    """
+    Request counters, latency histograms and in-flight gauge.
+
+    Series are stored in nested dicts keyed by the route template, method
+    and status code objects the request already carries, so recording a
+    request allocates no label strings. Labels are only rendered when
+    /metrics is scraped.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self._series: dict[str, dict[str, dict[int, _Series]]] = {}
+
+    def observe(self, route: str, method: str, status_code: int, duration: float) -> None:
+        """
+        Record one finished request.
+
+        Args:
+            route: Route template, e.g. "/tasks/{task_id}"
+            method: HTTP method
+            status_code: Response status code
+            duration: Request latency in seconds
+        """
+        by_method = self._series.get(route)
+        if by_method is None:
+            by_method = self._series[route] = {}
+        by_status = by_method.get(method)
+        if by_status is None:
+            by_status = by_method[method] = {}
+        series = by_status.get(status_code)
+        if series is None:
+            series = by_status[status_code] = _Series()
+
+        series.bucket_counts[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        series.total += duration
+        series.count += 1
+
+    def render(self) -> Iterable[str]:
+        """Yield the metrics in Prometheus text exposition format."""
+        labelled = [
+            (f'route="{route}",method="{method}",status="{status_code}"', series)
+            for route, by_method in self._series.items()
+            for method, by_status in by_method.items()
+            for status_code, series in by_status.items()
+        ]
+
+        yield "# HELP http_requests_total Total HTTP requests."
+        yield "# TYPE http_requests_total counter"
+        for labels, series in labelled:
+            yield f"http_requests_total{{{labels}}} {series.count}"
+
+        yield "# HELP http_request_duration_seconds HTTP request latency."
+        yield "# TYPE http_request_duration_seconds histogram"
+        for labels, series in labelled:
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS, series.bucket_counts):
+                cumulative += bucket_count
+                yield f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+            yield f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {series.count}'
+            yield f"http_request_duration_seconds_sum{{{labels}}} {series.total}"
+            yield f"http_request_duration_seconds_count{{{labels}}} {series.count}"
+
+        yield "# HELP http_requests_in_flight HTTP requests currently being served."
+        yield "# TYPE http_requests_in_flight gauge"
+        yield f"http_requests_in_flight {self.in_flight}"
+
+
+http_metrics = HTTPMetrics()
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware feeding HTTPMetrics.
+
+    Only requests whose matched route template starts with one of
+    ``path_prefixes`` are recorded; unmatched requests (404s on unknown
+    paths) are not, which keeps label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefixes: tuple[str, ...], metrics: HTTPMetrics = http_metrics):
+        self.app = app
+        self.path_prefixes = path_prefixes
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.in_flight -= 1
+            route = scope.get("route")
+            if route is not None and route.path.startswith(self.path_prefixes):
+                self.metrics.observe(route.path, scope["method"], status_code, time.perf_counter() - start)
+
+
+def render_gauges(gauges: Iterable[tuple[str, str, str, Callable[[], float]]]) -> Iterable[str]:
+    """
+    Render simple unlabelled metrics read at scrape time.
+
+    Args:
+        gauges: (name, type, help, value getter) tuples
+
+    Yields:
+        Lines in Prometheus text exposition format
+    """
+    for name, metric_type, help_text, value in gauges:
+        yield f"# HELP {name} {help_text}"
+        yield f"# TYPE {name} {metric_type}"
+        yield f"{name} {value()}"
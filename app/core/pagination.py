@@ -0,0 +1,65 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+
+def encode_cursor(sort_key: datetime | float, row_id: UUID, sort: str | None = None) -> str:
+    """
+    Encode a keyset pagination cursor.
+
+    The cursor is an opaque, URL-safe token holding the sort key and the
+    row ID of the last item on a page.
+
+    Args:
+        sort_key: Value of the sort column for the last row, a timestamp
+            or a number such as a search rank
+        row_id: ID of the last row (tie-breaker)
+        sort: Name of the sort order, for lists that offer several;
+            None for the default one
+
+    Returns:
+        Opaque cursor string
+    """
+    key = sort_key.isoformat() if isinstance(sort_key, datetime) else sort_key
+    fields = [key, str(row_id)] if sort is None else [key, str(row_id), sort]
+    payload = json.dumps(fields, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str,
+    key_type: type[datetime] | type[float] = datetime,
+    sort: str | None = None
+) -> tuple[Any, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+        key_type: Expected type of the sort key, datetime or float
+        sort: Expected sort order name, as passed to encode_cursor
+
+    Returns:
+        Tuple of (sort key, row ID)
+
+    Raises:
+        ValueError: If the cursor is malformed, or was issued for another
+            sort order or key type
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_key, row_id, *tag = json.loads(base64.urlsafe_b64decode(padded))
+        if tag != ([] if sort is None else [sort]):
+            raise ValueError(f"Cursor was issued for another sort order: {tag}")
+        if key_type is datetime:
+            sort_key = datetime.fromisoformat(sort_key)
+        elif isinstance(sort_key, (int, float)) and not isinstance(sort_key, bool):
+            sort_key = float(sort_key)
+        else:
+            raise TypeError(f"Expected a numeric sort key, got {sort_key!r}")
+        return sort_key, UUID(row_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
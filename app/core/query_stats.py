@@ -0,0 +1,146 @@
+import logging
+import re
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAM = re.compile(r"\$\d+")
+_VALUES_LIST = re.compile(r"(\([?, ]+\))(?:, \([?, ]+\))+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement so repeated shapes compare equal.
+
+    Bind parameters become ``?`` and multi-row VALUES lists collapse to
+    their first row.
+
+    Args:
+        statement: SQL statement as sent to the driver
+
+    Returns:
+        Normalized statement, truncated to 200 characters
+    """
+    normalized = _PARAM.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _VALUES_LIST.sub(r"\1, ...", normalized)[:200]
+
+
+class RequestQueryStats:
+    """Statements executed while serving one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.db_time = 0.0
+        self.statements: dict[str, list] = {}
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.db_time += elapsed
+        entry = self.statements.get(statement)
+        if entry is None:
+            self.statements[statement] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+def install_query_hooks(engine: AsyncEngine) -> None:
+    """
+    Register cursor execution hooks that feed the current request's stats.
+
+    Statements executed outside a request (e.g. by the scheduler) are
+    not recorded.
+
+    Args:
+        engine: Engine to instrument
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_stats.get() is not None:
+            conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        if stats is not None and conn.info.get("query_start"):
+            stats.record(statement, time.perf_counter() - conn.info["query_start"].pop())
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware that scopes query statistics to each request.
+
+    Adds a ``Server-Timing`` header with the statement count and total
+    database time, and logs requests exceeding SLOW_REQUEST_MAX_QUERIES
+    or SLOW_REQUEST_MS, or repeating one statement shape at least
+    N_PLUS_ONE_THRESHOLD times, together with their statement
+    fingerprints.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.db_time * 1000:.1f};desc="{stats.count} queries"'
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            self._check_slow(scope, stats, time.perf_counter() - start)
+
+    @staticmethod
+    def _check_slow(scope: Scope, stats: RequestQueryStats, duration: float) -> None:
+        """Log the request if it exceeded a query count or duration threshold."""
+        repeated = [
+            (statement, entry[0])
+            for statement, entry in stats.statements.items()
+            if entry[0] >= settings.N_PLUS_ONE_THRESHOLD
+        ]
+        if (
+            stats.count <= settings.SLOW_REQUEST_MAX_QUERIES
+            and duration * 1000 <= settings.SLOW_REQUEST_MS
+            and not repeated
+        ):
+            return
+
+        top = sorted(stats.statements.items(), key=lambda item: item[1][1], reverse=True)[:10]
+        details = "; ".join(
+            f"{count}x {elapsed * 1000:.1f}ms {fingerprint(statement)}"
+            for statement, (count, elapsed) in top
+        )
+        logger.warning(
+            f"Slow request {scope['method']} {scope['path']}: "
+            f"{duration * 1000:.1f}ms total, {stats.count} queries, "
+            f"{stats.db_time * 1000:.1f}ms in database"
+            + (f", possible N+1 on {len(repeated)} statement(s)" if repeated else "")
+            + f" | {details}"
+        )
@@ -0,0 +1,70 @@
+from typing import Any, Iterable, Mapping
+from uuid import UUID
+
+import orjson
+from fastapi import Response
+from pydantic_core import to_jsonable_python
+from sqlalchemy.engine import Result
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def rows_as_dicts(result: Result) -> list[dict[str, Any]]:
+    """
+    Convert a Core result of plain columns to a list of dicts.
+
+    Avoids building ORM instances (identity map, attribute state) for
+    read-only listings.
+
+    Args:
+        result: Result of a ``select()`` of columns
+
+    Returns:
+        One dict per row, keyed by column label
+    """
+    # Labels of table columns are quoted_name, a str subclass orjson rejects as a key
+    keys = tuple(str(key) for key in result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+def _default(value: Any) -> Any:
+    # asyncpg returns its own UUID subclass, which orjson does not encode natively
+    if isinstance(value, UUID):
+        return str(value)
+    # Anything else orjson lacks (e.g. timedelta) is encoded the way Pydantic does
+    return to_jsonable_python(value)
+
+
+def json_response(content: Any, headers: Mapping[str, str] | None = None) -> Response:
+    """
+    Serialize already-shaped data with orjson, bypassing response_model validation.
+
+    UUIDs, enums and datetimes are encoded natively; UTC datetimes use
+    the ``Z`` suffix, as Pydantic does.
+
+    Args:
+        content: Dicts/lists of JSON-compatible values
+        headers: Optional response headers
+
+    Returns:
+        JSON response
+    """
+    return Response(
+        content=orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z),
+        media_type="application/json",
+        headers=headers
+    )
+
+
+def encode_ndjson(items: Iterable[Any]) -> bytes:
+    """
+    Encode items as newline-delimited JSON, one line per item.
+
+    Args:
+        items: Dicts of JSON-compatible values
+
+    Returns:
+        NDJSON bytes, ending with a newline
+    """
+    option = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+    return b"".join(orjson.dumps(item, default=_default, option=option) for item in items)
@@ -0,0 +1,169 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import ColumnElement, any_, delete, insert, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Subquery
+
+from app.models.archive import ReminderArchive, TaskArchive
+from app.models.reminder import Reminder
+from app.models.task import Task, TaskStatus
+
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.CANCELLED)
+
+
+def _archived_columns(model: type) -> list[str]:
+    """Names of the live table columns copied to the archive; generated columns are not."""
+    return [column.name for column in model.__table__.columns if column.computed is None]
+
+
+def _with_archive(model: type, archive_model: type, name: str) -> Subquery:
+    """UNION ALL of a live table and its archive, over the archived columns."""
+    columns = _archived_columns(model)
+    return union_all(
+        select(*(model.__table__.columns[name] for name in columns)),
+        select(*(archive_model.__table__.columns[name] for name in columns))
+    ).subquery(name)
+
+
+def tasks_with_archive() -> Subquery:
+    """Live and archived tasks as one selectable."""
+    return _with_archive(Task, TaskArchive, "tasks_all")
+
+
+def reminders_with_archive() -> Subquery:
+    """Live and archived reminders as one selectable."""
+    return _with_archive(Reminder, ReminderArchive, "reminders_all")
+
+
+async def _move_rows(
+    db: AsyncSession,
+    model: type,
+    archive_model: type,
+    condition: ColumnElement[bool],
+    archive: bool
+) -> int:
+    """
+    Delete matching rows, copying them to the archive table in the same statement.
+
+    Args:
+        db: Async database session
+        model: Live model
+        archive_model: Archive model with the same columns plus archived_at
+        condition: Rows to move
+        archive: Copy rows to the archive table; if False they are only deleted
+
+    Returns:
+        Number of rows moved
+    """
+    if not archive:
+        result = await db.execute(
+            delete(model).where(condition).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    columns = _archived_columns(model)
+    moved = (
+        delete(model)
+        .where(condition)
+        .returning(*(model.__table__.columns[name] for name in columns))
+        .cte("moved")
+    )
+    result = await db.execute(
+        insert(archive_model).from_select(columns, select(*(moved.c[name] for name in columns)))
+    )
+    return result.rowcount
+
+
+async def archive_sent_reminders(
+    db: AsyncSession,
+    sent_before: datetime,
+    limit: int,
+    archive: bool = True
+) -> int:
+    """
+    Move one batch of sent reminders due before ``sent_before`` and commit.
+
+    Rows are picked with FOR UPDATE SKIP LOCKED, so concurrent workers
+    move disjoint batches and row locks are held for one short
+    transaction only.
+
+    Args:
+        db: Async database session
+        sent_before: Only reminders due before this time are moved
+        limit: Maximum number of reminders to move
+        archive: Copy rows to reminders_archive; if False they are deleted
+
+    Returns:
+        Number of reminders moved
+    """
+    result = await db.execute(
+        select(Reminder.id)
+        .where(Reminder.sent == True, Reminder.remind_at < sent_before)
+        .order_by(Reminder.remind_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    ids = list(result.scalars())
+    if not ids:
+        return 0
+
+    moved = await _move_rows(db, Reminder, ReminderArchive, Reminder.id == any_(ids), archive)
+    await db.commit()
+    return moved
+
+
+async def archive_finished_tasks(
+    db: AsyncSession,
+    finished_before: datetime,
+    limit: int,
+    archive: bool = True
+) -> tuple[int, int]:
+    """
+    Move one batch of completed or cancelled tasks, with all their reminders, and commit.
+
+    A task counts as finished when its status is final and it was last
+    updated before ``finished_before``. Rows are picked with FOR UPDATE
+    SKIP LOCKED, as in archive_sent_reminders. Tasks with an unsent
+    reminder leased by the scheduler (being delivered, or waiting for a
+    retry) are left for a later run, so no reminder is archived while it
+    is being sent.
+
+    Args:
+        db: Async database session
+        finished_before: Only tasks last updated before this time are moved
+        limit: Maximum number of tasks to move
+        archive: Copy rows to the archive tables; if False they are deleted
+
+    Returns:
+        Tuple of (tasks moved, reminders moved)
+    """
+    result = await db.execute(
+        select(Task.id)
+        .where(Task.status.in_(FINISHED_STATUSES), Task.updated_at < finished_before)
+        .order_by(Task.updated_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    ids = list(result.scalars())
+    if not ids:
+        return 0, 0
+
+    # Locking the unsent reminders waits for claims in flight and blocks
+    # new ones until commit, so the lease check below cannot go stale
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        select(Reminder.task_id, Reminder.claimed_until)
+        .where(Reminder.task_id == any_(ids), Reminder.sent == False)
+        .with_for_update()
+    )
+    leased = {task_id for task_id, claimed_until in result if claimed_until is not None and claimed_until > now}
+    ids = [task_id for task_id in ids if task_id not in leased]
+    if not ids:
+        await db.commit()
+        return 0, 0
+
+    # Reminders first: deleting the tasks would cascade to them
+    reminders = await _move_rows(db, Reminder, ReminderArchive, Reminder.task_id == any_(ids), archive)
+    tasks = await _move_rows(db, Task, TaskArchive, Task.id == any_(ids), archive)
+    await db.commit()
+    return tasks, reminders
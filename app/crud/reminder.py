@@ -1,12 +1,26 @@
-from datetime import datetime
-from typing import Sequence
+import uuid
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import ColumnElement, select, and_, any_, delete, exists, func, or_, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.models.reminder import Reminder
-from app.schemas.reminder import ReminderCreate
+from app.core.serialization import rows_as_dicts
+from app.crud.archive import reminders_with_archive
+from app.models.reminder import Reminder, ReminderChannel
+from app.schemas.reminder import Reminder as ReminderSchema, ReminderCreate
+
+# Columns of the public reminder schema, in its field order
+REMINDER_COLUMNS = tuple(getattr(Reminder, field) for field in ReminderSchema.model_fields)
+
+# Monthly partitions of the reminders table (see migration 007)
+PARTITION_NAME_FORMAT = "reminders_y%Ym%m"
+DEFAULT_PARTITION = "reminders_default"
+# Advisory lock serializing partition maintenance across workers
+PARTITION_LOCK_KEY = 0x72656d70
 
 
 async def create_reminder(db: AsyncSession, reminder_in: ReminderCreate) -> Reminder:
@@ -27,6 +41,41 @@ async def create_reminder(db: AsyncSession, reminder_in: ReminderCreate) -> Remi
     return db_reminder
 
 
+async def create_reminders(
+    db: AsyncSession,
+    reminders_in: Sequence[ReminderCreate]
+) -> list[Reminder | None]:
+    """
+    Create many reminders in a single transaction.
+
+    Rows are inserted with ON CONFLICT DO NOTHING against the
+    (task_id, remind_at, channel) unique constraint, so retried
+    submissions do not create duplicates. Parent tasks are expected to
+    have been validated by the caller.
+
+    Args:
+        db: Async database session
+        reminders_in: Reminder creation schemas
+
+    Returns:
+        One entry per input, in order: the created reminder, or None if an
+        identical reminder already existed
+    """
+    rows = [
+        {"id": uuid.uuid4(), **reminder_in.model_dump()}
+        for reminder_in in reminders_in
+    ]
+    result = await db.scalars(
+        pg_insert(Reminder)
+        .on_conflict_do_nothing(constraint="uq_reminders_task_id_remind_at_channel")
+        .returning(Reminder),
+        rows
+    )
+    created = {db_reminder.id: db_reminder for db_reminder in result.all()}
+    await db.commit()
+    return [created.get(row["id"]) for row in rows]
+
+
 async def get_reminder(db: AsyncSession, reminder_id: UUID) -> Reminder | None:
     """
     Retrieve a reminder by ID.
@@ -44,70 +93,427 @@ async def get_reminder(db: AsyncSession, reminder_id: UUID) -> Reminder | None:
     return result.scalar_one_or_none()
 
 
+async def get_reminders_by_ids(
+    db: AsyncSession,
+    reminder_ids: Sequence[UUID]
+) -> dict[UUID, dict[str, Any]]:
+    """
+    Retrieve many reminders by ID with one query.
+
+    Args:
+        db: Async database session
+        reminder_ids: Reminder UUIDs to look up
+
+    Returns:
+        Reminder dicts keyed by the public schema fields, by ID; IDs that
+        do not exist are absent
+    """
+    result = await db.execute(
+        select(*REMINDER_COLUMNS).where(Reminder.id == any_(list(set(reminder_ids))))
+    )
+    return {reminder["id"]: reminder for reminder in rows_as_dicts(result)}
+
+
 async def get_reminders(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     task_id: UUID | None = None,
-    sent: bool | None = None
-) -> Sequence[Reminder]:
+    sent: bool | None = None,
+    after: tuple[datetime, UUID] | None = None,
+    include_archived: bool = False
+) -> list[dict[str, Any]]:
     """
     Retrieve multiple reminders with optional filtering.
 
+    Reminders are ordered by (remind_at, id). When ``after`` is given, the
+    page starts right after that key (keyset pagination) and ``skip`` is
+    ignored. Only the public columns are selected, as plain dicts.
+    With ``include_archived``, rows moved to reminders_archive by the
+    retention job are listed too, in the same order.
+
     Args:
         db: Async database session
         skip: Number of records to skip
         limit: Maximum number of records to return
         task_id: Optional task ID filter
         sent: Optional sent status filter
+        after: Optional (remind_at, id) of the last reminder on the previous page
+        include_archived: Also list archived reminders
+
+    Returns:
+        List of reminder dicts keyed by the public schema fields
+    """
+    columns = reminders_with_archive().c if include_archived else Reminder.__table__.c
+    query = select(*(columns[column.key] for column in REMINDER_COLUMNS))
+
+    filters = []
+    if task_id:
+        filters.append(columns.task_id == task_id)
+    if sent is not None:
+        filters.append(columns.sent == sent)
+
+    if after is not None:
+        filters.append(tuple_(columns.remind_at, columns.id) > tuple_(*after))
+
+    if filters:
+        query = query.where(and_(*filters))
+
+    if after is None:
+        query = query.offset(skip)
+
+    query = query.limit(limit).order_by(columns.remind_at.asc(), columns.id.asc())
+
+    result = await db.execute(query)
+    return rows_as_dicts(result)
+
+
+async def get_reminders_by_task(
+    db: AsyncSession,
+    task_ids: Sequence[UUID],
+    include_archived: bool = False
+) -> dict[UUID, list[dict[str, Any]]]:
+    """
+    Retrieve the reminders of many tasks with one query.
+
+    Args:
+        db: Async database session
+        task_ids: Task UUIDs, e.g. those of one page of tasks
+        include_archived: Also return archived reminders
 
     Returns:
-        List of reminder instances
+        Reminder dicts keyed by the public schema fields, grouped by task
+        ID and ordered by (remind_at, id); every given task ID is present
     """
-    query = select(Reminder)
+    by_task: dict[UUID, list[dict[str, Any]]] = {task_id: [] for task_id in task_ids}
+    if not by_task:
+        return by_task
+
+    columns = reminders_with_archive().c if include_archived else Reminder.__table__.c
+    query = (
+        select(*(columns[column.key] for column in REMINDER_COLUMNS))
+        .where(columns.task_id == any_(list(by_task)))
+        .order_by(columns.remind_at.asc(), columns.id.asc())
+    )
+    result = await db.execute(query)
+    for reminder in rows_as_dicts(result):
+        by_task[reminder["task_id"]].append(reminder)
+    return by_task
+
 
+async def stream_reminders(
+    db: AsyncSession,
+    task_id: UUID | None = None,
+    sent: bool | None = None,
+    remind_after: datetime | None = None,
+    remind_before: datetime | None = None,
+    batch_size: int = 1000
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Stream all matching reminders through a server-side cursor.
+
+    Rows are fetched ``batch_size`` at a time, so memory stays flat
+    whatever the table size. The session's connection is held until
+    the iterator is exhausted or closed.
+
+    Args:
+        db: Async database session
+        task_id: Optional task ID filter
+        sent: Optional sent status filter
+        remind_after: Optional lower bound on remind_at (inclusive)
+        remind_before: Optional upper bound on remind_at (exclusive)
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        Batches of reminder dicts keyed by the public schema fields,
+        ordered by (remind_at, id)
+    """
     filters = []
     if task_id:
         filters.append(Reminder.task_id == task_id)
     if sent is not None:
         filters.append(Reminder.sent == sent)
+    if remind_after is not None:
+        filters.append(Reminder.remind_at >= remind_after)
+    if remind_before is not None:
+        filters.append(Reminder.remind_at < remind_before)
 
+    query = select(*REMINDER_COLUMNS)
     if filters:
         query = query.where(and_(*filters))
+    query = query.order_by(Reminder.remind_at, Reminder.id).execution_options(yield_per=batch_size)
 
-    query = query.offset(skip).limit(limit).order_by(Reminder.remind_at.asc())
+    result = await db.stream(query)
+    keys = tuple(result.keys())
+    async for rows in result.partitions():
+        yield [dict(zip(keys, row)) for row in rows]
 
-    result = await db.execute(query)
+
+def _unclaimed(current_time: datetime) -> ColumnElement[bool]:
+    """Reminders not leased by a scheduler worker at ``current_time``."""
+    return or_(Reminder.claimed_until.is_(None), Reminder.claimed_until <= current_time)
+
+
+async def get_upcoming_remind_times(
+    db: AsyncSession,
+    until: datetime,
+    limit: int
+) -> Sequence[datetime]:
+    """
+    Get the times at which unsent reminders can be sent, up to ``until``.
+
+    That is the due time, or the end of the claim for a reminder leased
+    by a scheduler worker (being sent, or waiting to be retried).
+    Overdue reminders are included.
+
+    Args:
+        db: Async database session
+        until: End of the lookahead window (exclusive)
+        limit: Maximum number of times to return
+
+    Returns:
+        Sorted list of send times
+    """
+    # GREATEST ignores NULLs, so unclaimed reminders give remind_at
+    send_at = func.greatest(Reminder.remind_at, Reminder.claimed_until)
+    result = await db.execute(
+        select(send_at)
+        .where(
+            and_(
+                Reminder.sent == False,
+                Reminder.remind_at < until,
+                send_at < until
+            )
+        )
+        .order_by(send_at.asc())
+        .limit(limit)
+    )
     return result.scalars().all()
 
 
-async def get_pending_reminders(
+async def count_due_reminders(
     db: AsyncSession,
     current_time: datetime
-) -> Sequence[Reminder]:
+) -> tuple[int, datetime | None]:
     """
-    Get all unsent reminders that are due.
+    Count unsent reminders that are due.
 
     Args:
         db: Async database session
-        current_time: Current datetime to check against
+        current_time: Reminders due at or before this time are counted
 
     Returns:
-        List of pending reminder instances
+        Tuple of (count, due time of the oldest one or None)
     """
     result = await db.execute(
-        select(Reminder)
+        select(func.count(), func.min(Reminder.remind_at))
         .where(
             and_(
                 Reminder.sent == False,
                 Reminder.remind_at <= current_time
             )
         )
+    )
+    count, oldest = result.one()
+    return count, oldest
+
+
+async def claim_stale_reminders(
+    db: AsyncSession,
+    stale_before: datetime,
+    current_time: datetime,
+    limit: int,
+    superseded_only: bool = False
+) -> Sequence[Reminder]:
+    """
+    Claim a batch of unsent reminders that are due before ``stale_before``.
+
+    Rows are locked with FOR UPDATE SKIP LOCKED and reminders leased by
+    claim_due_reminders are skipped, so a batch being sent is not dropped.
+
+    Args:
+        db: Async database session
+        stale_before: Only reminders due before this time are claimed
+        current_time: Current datetime
+        limit: Maximum number of reminders to claim
+        superseded_only: Only claim reminders for which a later unsent
+            reminder of the same task and channel is also due
+
+    Returns:
+        List of claimed reminder instances, oldest first
+    """
+    filters = [
+        Reminder.sent == False,
+        Reminder.remind_at < stale_before,
+        _unclaimed(current_time)
+    ]
+    if superseded_only:
+        later = aliased(Reminder)
+        filters.append(
+            exists().where(
+                later.task_id == Reminder.task_id,
+                later.channel == Reminder.channel,
+                later.sent == False,
+                later.remind_at > Reminder.remind_at,
+                later.remind_at <= current_time
+            )
+        )
+
+    result = await db.execute(
+        select(Reminder)
+        .where(and_(*filters))
         .order_by(Reminder.remind_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
     )
     return result.scalars().all()
 
 
+async def claim_due_reminders(
+    db: AsyncSession,
+    current_time: datetime,
+    limit: int,
+    lease_until: datetime,
+    channel: ReminderChannel | None = None
+) -> Sequence[Reminder]:
+    """
+    Claim a batch of unsent reminders that are due and commit.
+
+    The batch is picked with FOR UPDATE SKIP LOCKED, so concurrent
+    workers each claim a disjoint batch, and leased by setting
+    claimed_until to ``lease_until``. The claim commits right away, so
+    no row lock or transaction is held while the batch is sent; other
+    workers skip leased reminders until the lease expires.
+
+    Args:
+        db: Async database session
+        current_time: Current datetime to check against
+        limit: Maximum number of reminders to claim
+        lease_until: End of the claim; must leave time to send the batch
+        channel: Optional channel filter
+
+    Returns:
+        List of claimed reminder instances, oldest first
+    """
+    filters = [
+        Reminder.sent == False,
+        Reminder.remind_at <= current_time,
+        _unclaimed(current_time)
+    ]
+    if channel is not None:
+        filters.append(Reminder.channel == channel)
+
+    due = (
+        select(Reminder.id, Reminder.remind_at)
+        .where(and_(*filters))
+        .order_by(Reminder.remind_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.scalars(
+        update(Reminder)
+        .where(tuple_(Reminder.id, Reminder.remind_at).in_(due))
+        .values(claimed_until=lease_until)
+        .returning(Reminder)
+        .execution_options(populate_existing=True)
+    )
+    batch = sorted(result.all(), key=lambda reminder: reminder.remind_at)
+    await db.commit()
+    return batch
+
+
+async def release_reminders(
+    db: AsyncSession,
+    reminder_ids: Sequence[UUID],
+    retry_at: datetime
+) -> int:
+    """
+    Shorten the claim of reminders that failed to send and commit.
+
+    The reminders become claimable again at ``retry_at``.
+
+    Args:
+        db: Async database session
+        reminder_ids: Reminder UUIDs
+        retry_at: Time from which the reminders may be claimed again
+
+    Returns:
+        Number of reminders updated
+    """
+    result = await db.execute(
+        update(Reminder)
+        .where(Reminder.id == any_(list(reminder_ids)))
+        .values(claimed_until=retry_at)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def create_next_occurrences(
+    db: AsyncSession,
+    reminders: Sequence[Reminder],
+    after: datetime
+) -> list[datetime]:
+    """
+    Create the next occurrence of each recurring reminder, without committing.
+
+    Meant to run in the same transaction that marks the reminders sent.
+    An occurrence that already exists is skipped.
+
+    Args:
+        db: Async database session
+        reminders: Reminders that were just delivered
+        after: Next occurrences fall strictly after this time
+
+    Returns:
+        Due times of the created occurrences
+    """
+    rows = []
+    for reminder in reminders:
+        next_at = reminder.next_occurrence(after)
+        if next_at is not None:
+            rows.append({
+                "id": uuid.uuid4(),
+                "task_id": reminder.task_id,
+                "remind_at": next_at,
+                "channel": reminder.channel,
+                "repeat_interval": reminder.repeat_interval,
+                "repeat_until": reminder.repeat_until,
+            })
+    if not rows:
+        return []
+
+    result = await db.scalars(
+        pg_insert(Reminder)
+        .values(rows)
+        .on_conflict_do_nothing(constraint="uq_reminders_task_id_remind_at_channel")
+        .returning(Reminder.remind_at)
+    )
+    return list(result.all())
+
+
+async def mark_reminders_sent(db: AsyncSession, reminder_ids: Sequence[UUID]) -> int:
+    """
+    Mark many reminders as sent with a single statement and commit.
+
+    Args:
+        db: Async database session
+        reminder_ids: Reminder UUIDs
+
+    Returns:
+        Number of reminders updated
+    """
+    result = await db.execute(
+        update(Reminder)
+        .where(Reminder.id == any_(list(reminder_ids)))
+        .values(sent=True)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
+
+
 async def mark_reminder_sent(db: AsyncSession, reminder_id: UUID) -> Reminder | None:
     """
     Mark a reminder as sent.
@@ -119,13 +525,15 @@ async def mark_reminder_sent(db: AsyncSession, reminder_id: UUID) -> Reminder |
     Returns:
         Updated reminder instance or None if not found
     """
-    db_reminder = await get_reminder(db, reminder_id)
-    if not db_reminder:
-        return None
-
-    db_reminder.sent = True
+    result = await db.scalars(
+        update(Reminder)
+        .where(Reminder.id == reminder_id)
+        .values(sent=True)
+        .returning(Reminder)
+        .execution_options(populate_existing=True)
+    )
+    db_reminder = result.one_or_none()
     await db.commit()
-    await db.refresh(db_reminder)
     return db_reminder
 
 
@@ -140,11 +548,123 @@ async def delete_reminder(db: AsyncSession, reminder_id: UUID) -> bool:
     Returns:
         True if reminder was deleted, False if not found
     """
-    db_reminder = await get_reminder(db, reminder_id)
-    if not db_reminder:
-        return False
+    result = await db.execute(
+        delete(Reminder).where(Reminder.id == reminder_id).returning(Reminder.id)
+    )
+    deleted = result.scalar_one_or_none() is not None
+    await db.commit()
+    return deleted
+
+
+def _month_start(value: datetime) -> datetime:
+    """First instant of the UTC month containing ``value``."""
+    return value.astimezone(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(month: datetime) -> datetime:
+    """First instant of the month after ``month``, which must be a month start."""
+    return month.replace(year=month.year + month.month // 12, month=month.month % 12 + 1)
+
+
+async def _lock_partitions(db: AsyncSession) -> dict[str, datetime]:
+    """
+    Serialize partition maintenance and list the monthly reminders partitions.
 
-    await db.delete(db_reminder)
+    Returns:
+        Mapping of partition name to the start of its month
+    """
+    # Attaching and detaching need short exclusive locks; fail fast rather
+    # than queue behind long queries and block everything behind us
+    await db.execute(text("SET LOCAL lock_timeout = '5s'"))
+    await db.execute(select(func.pg_advisory_xact_lock(PARTITION_LOCK_KEY)))
+    result = await db.scalars(
+        text("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = 'reminders'::regclass")
+    )
+    partitions = {}
+    for name in result:
+        try:
+            partitions[name] = datetime.strptime(name, PARTITION_NAME_FORMAT).replace(tzinfo=timezone.utc)
+        except ValueError:
+            # The default partition
+            continue
+    return partitions
+
+
+async def create_reminder_partitions(db: AsyncSession, months_ahead: int) -> list[str]:
+    """
+    Create the monthly reminders partitions up to ``months_ahead`` months from now, and commit.
+
+    Reminders already stored in the default partition for a new month
+    are moved into it, so the default partition only holds rows too far
+    out to have a partition yet. Safe to run from several workers.
+
+    Args:
+        db: Async database session
+        months_ahead: Number of months after the current one to cover
+
+    Returns:
+        Names of the partitions created
+    """
+    existing = await _lock_partitions(db)
+    month = _month_start(datetime.now(timezone.utc))
+    created = []
+    for _ in range(months_ahead + 1):
+        upper = _next_month(month)
+        name = month.strftime(PARTITION_NAME_FORMAT)
+        if name not in existing:
+            await db.execute(text(f"CREATE TABLE {name} (LIKE reminders INCLUDING DEFAULTS)"))
+            await db.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                    f"WHERE remind_at >= :lower AND remind_at < :upper RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                ),
+                {"lower": month, "upper": upper}
+            )
+            await db.execute(text(
+                f"ALTER TABLE reminders ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            ))
+            created.append(name)
+        month = upper
     await db.commit()
-    return True
+    return created
+
+
+async def drop_reminder_partitions(
+    db: AsyncSession,
+    before: datetime,
+    require_empty: bool = True
+) -> list[str]:
+    """
+    Detach and drop monthly reminders partitions that end before ``before``, and commit.
+
+    Dropping a partition removes a whole month of reminders instantly,
+    without the row-by-row cost of DELETE. Partitions still holding
+    unsent reminders are always kept.
 
+    Args:
+        db: Async database session
+        before: Only partitions whose month ends at or before this time are dropped
+        require_empty: Only drop partitions without any rows (e.g. after
+            their rows were archived); if False, partitions holding only
+            sent reminders are dropped too
+
+    Returns:
+        Names of the partitions dropped
+    """
+    existing = await _lock_partitions(db)
+    dropped = []
+    for name, month in sorted(existing.items(), key=lambda item: item[1]):
+        if _next_month(month) > before:
+            break
+        # Block inserts while checking, so no row slips in before the drop
+        await db.execute(text(f"LOCK TABLE {name} IN SHARE MODE"))
+        condition = "" if require_empty else " WHERE sent = false"
+        if await db.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {name}{condition})")):
+            continue
+        await db.execute(text(f"ALTER TABLE reminders DETACH PARTITION {name}"))
+        await db.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    await db.commit()
+    return dropped
@@ -1,11 +1,18 @@
-from typing import Sequence
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import any_, delete, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.models.task import Task, TaskStatus
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.core.serialization import rows_as_dicts
+from app.crud.archive import tasks_with_archive
+from app.models.task import SEARCH_CONFIG, Task, TaskStatus
+from app.schemas.task import Task as TaskSchema, TaskCreate, TaskSort, TaskUpdate
+
+# Columns of the public task schema, in its field order
+TASK_COLUMNS = tuple(getattr(Task, field) for field in TaskSchema.model_fields)
 
 
 async def create_task(db: AsyncSession, task_in: TaskCreate) -> Task:
@@ -26,50 +33,236 @@ async def create_task(db: AsyncSession, task_in: TaskCreate) -> Task:
     return db_task
 
 
-async def get_task(db: AsyncSession, task_id: UUID) -> Task | None:
+async def create_tasks(db: AsyncSession, tasks_in: Sequence[TaskCreate]) -> Sequence[Task]:
+    """
+    Create many tasks in a single transaction.
+
+    Rows are sent as multi-row INSERT ... RETURNING statements instead of
+    one add/commit/refresh round trip per task.
+
+    Args:
+        db: Async database session
+        tasks_in: Task creation schemas
+
+    Returns:
+        Created task instances, in the same order as ``tasks_in``
+    """
+    result = await db.scalars(
+        insert(Task).returning(Task, sort_by_parameter_order=True),
+        [task_in.model_dump() for task_in in tasks_in]
+    )
+    db_tasks = result.all()
+    await db.commit()
+    return db_tasks
+
+
+async def get_task(db: AsyncSession, task_id: UUID, with_reminders: bool = False) -> Task | None:
     """
     Retrieve a task by ID.
 
     Args:
         db: Async database session
         task_id: Task UUID
+        with_reminders: Also load Task.reminders, with one extra query
 
     Returns:
         Task instance or None if not found
     """
+    query = select(Task).where(Task.id == task_id)
+    if with_reminders:
+        query = query.options(selectinload(Task.reminders))
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def get_tasks_by_ids(db: AsyncSession, task_ids: Sequence[UUID]) -> dict[UUID, dict[str, Any]]:
+    """
+    Retrieve many tasks by ID with one query.
+
+    Args:
+        db: Async database session
+        task_ids: Task UUIDs to look up
+
+    Returns:
+        Task dicts keyed by the public schema fields, by ID; IDs that do
+        not exist are absent
+    """
     result = await db.execute(
-        select(Task).where(Task.id == task_id)
+        select(*TASK_COLUMNS).where(Task.id == any_(list(set(task_ids))))
     )
-    return result.scalar_one_or_none()
+    return {task["id"]: task for task in rows_as_dicts(result)}
+
+
+async def get_existing_task_ids(db: AsyncSession, task_ids: Sequence[UUID]) -> set[UUID]:
+    """
+    Return which of the given task IDs exist, using one set-based query.
+
+    Args:
+        db: Async database session
+        task_ids: Task UUIDs to look up
+
+    Returns:
+        Subset of ``task_ids`` that exist in the database
+    """
+    result = await db.scalars(
+        select(Task.id).where(Task.id == any_(list(set(task_ids))))
+    )
+    return set(result.all())
 
 
 async def get_tasks(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
-    status: TaskStatus | None = None
-) -> Sequence[Task]:
+    status: TaskStatus | None = None,
+    after: tuple[datetime, UUID] | None = None,
+    include_archived: bool = False,
+    due_after: datetime | None = None,
+    due_before: datetime | None = None,
+    overdue: bool = False,
+    sort: TaskSort = TaskSort.CREATED_AT
+) -> list[dict[str, Any]]:
     """
     Retrieve multiple tasks with optional filtering.
 
+    Tasks are ordered newest first by (created_at, id), or soonest due
+    first by (due_time, id) with ``sort=TaskSort.DUE_TIME``, which leaves
+    out tasks without a due time. When ``after`` is given, the page
+    starts right after that key (keyset pagination) and ``skip`` is
+    ignored, so deep pages cost the same as the first one.
+
+    Only the public columns are selected and returned as plain dicts,
+    without ORM instances, so large pages stay cheap to build. With
+    ``include_archived``, tasks moved to tasks_archive by the retention
+    job are listed too, in the same order.
+
     Args:
         db: Async database session
         skip: Number of records to skip
         limit: Maximum number of records to return
         status: Optional status filter
+        after: Optional sort key and id of the last task on the previous page
+        include_archived: Also list archived tasks
+        due_after: Optional lower bound on due_time (inclusive)
+        due_before: Optional upper bound on due_time (exclusive)
+        overdue: Only pending tasks whose due time has passed
+        sort: Sort order
 
     Returns:
-        List of task instances
+        List of task dicts keyed by the public schema fields
     """
-    query = select(Task)
+    columns = tasks_with_archive().c if include_archived else Task.__table__.c
+    query = select(*(columns[column.key] for column in TASK_COLUMNS))
 
     if status:
-        query = query.where(Task.status == status)
+        query = query.where(columns.status == status)
+    if due_after is not None:
+        query = query.where(columns.due_time >= due_after)
+    if due_before is not None:
+        query = query.where(columns.due_time < due_before)
+    if overdue:
+        query = query.where(columns.status == TaskStatus.PENDING, columns.due_time < func.now())
+
+    if sort is TaskSort.DUE_TIME:
+        query = query.where(columns.due_time.is_not(None))
+        if after is not None:
+            query = query.where(tuple_(columns.due_time, columns.id) > tuple_(*after))
+        order_by = (columns.due_time, columns.id)
+    else:
+        if after is not None:
+            query = query.where(tuple_(columns.created_at, columns.id) < tuple_(*after))
+        order_by = (columns.created_at.desc(), columns.id.desc())
 
-    query = query.offset(skip).limit(limit).order_by(Task.created_at.desc())
+    if after is None:
+        query = query.offset(skip)
+
+    query = query.limit(limit).order_by(*order_by)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    return rows_as_dicts(result)
+
+
+async def search_tasks(
+    db: AsyncSession,
+    query: str,
+    limit: int = 100,
+    status: TaskStatus | None = None,
+    after: tuple[float, UUID] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Full-text search over task titles and descriptions.
+
+    ``query`` uses web search syntax: words are ANDed, "quoted phrases"
+    match in order, ``or`` between words and ``-word`` exclusions are
+    supported. Matches are found through the GIN index on search_vector
+    and ordered by rank (title matches weigh more), then ID, both
+    descending. When ``after`` is given, the page starts right after
+    that (rank, id) key.
+
+    Args:
+        db: Async database session
+        query: Search terms
+        limit: Maximum number of records to return
+        status: Optional status filter
+        after: Optional (rank, id) of the last task on the previous page
+
+    Returns:
+        List of task dicts keyed by the public schema fields, plus rank
+    """
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+    rank = func.ts_rank(Task.search_vector, tsquery)
+
+    stmt = select(*TASK_COLUMNS, rank.label("rank")).where(Task.search_vector.bool_op("@@")(tsquery))
+    if status:
+        stmt = stmt.where(Task.status == status)
+    if after is not None:
+        stmt = stmt.where(tuple_(rank, Task.id) < tuple_(*after))
+    stmt = stmt.order_by(rank.desc(), Task.id.desc()).limit(limit)
+
+    result = await db.execute(stmt)
+    return rows_as_dicts(result)
+
+
+async def stream_tasks(
+    db: AsyncSession,
+    status: TaskStatus | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    batch_size: int = 1000
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Stream all matching tasks through a server-side cursor.
+
+    Rows are fetched ``batch_size`` at a time, so memory stays flat
+    whatever the table size. The session's connection is held until
+    the iterator is exhausted or closed.
+
+    Args:
+        db: Async database session
+        status: Optional status filter
+        created_after: Optional lower bound on created_at (inclusive)
+        created_before: Optional upper bound on created_at (exclusive)
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        Batches of task dicts keyed by the public schema fields,
+        ordered by (created_at, id)
+    """
+    query = select(*TASK_COLUMNS)
+
+    if status:
+        query = query.where(Task.status == status)
+    if created_after is not None:
+        query = query.where(Task.created_at >= created_after)
+    if created_before is not None:
+        query = query.where(Task.created_at < created_before)
+
+    query = query.order_by(Task.created_at, Task.id).execution_options(yield_per=batch_size)
+
+    result = await db.stream(query)
+    keys = tuple(result.keys())
+    async for rows in result.partitions():
+        yield [dict(zip(keys, row)) for row in rows]
 
 
 async def update_task(
@@ -88,19 +281,20 @@ async def update_task(
     Returns:
         Updated task instance or None if not found
     """
-    # Get existing task
-    db_task = await get_task(db, task_id)
-    if not db_task:
-        return None
-
-    # Update only provided fields
     update_data = task_update.model_dump(exclude_unset=True)
+    if not update_data:
+        return await get_task(db, task_id)
 
-    for field, value in update_data.items():
-        setattr(db_task, field, value)
-
+    # Single UPDATE ... RETURNING; no row means the task does not exist
+    result = await db.scalars(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**update_data)
+        .returning(Task)
+        .execution_options(populate_existing=True)
+    )
+    db_task = result.one_or_none()
     await db.commit()
-    await db.refresh(db_task)
     return db_task
 
 
@@ -115,11 +309,10 @@ async def delete_task(db: AsyncSession, task_id: UUID) -> bool:
     Returns:
         True if task was deleted, False if not found
     """
-    db_task = await get_task(db, task_id)
-    if not db_task:
-        return False
-
-    await db.delete(db_task)
+    # Reminders are removed by the ON DELETE CASCADE foreign key
+    result = await db.execute(
+        delete(Task).where(Task.id == task_id).returning(Task.id)
+    )
+    deleted = result.scalar_one_or_none() is not None
     await db.commit()
-    return True
-
+    return deleted
@@ -0,0 +1,209 @@
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import BigInteger, ColumnElement, Select, and_, cast, func, literal, or_, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import Task, TaskSource, TaskStatus
+from app.models.task_stats import TaskStatsCounter, TaskStatsState
+
+
+def _sum(column: Any) -> ColumnElement[int]:
+    """sum() of a bigint column as bigint (Postgres returns numeric)."""
+    return cast(func.sum(column), BigInteger)
+
+
+def _overdue_tail(since: Any, until: Any) -> Select:
+    """Pending tasks per source that became overdue in [since, until)."""
+    return (
+        select(Task.source, func.count().label("overdue"))
+        .where(Task.status == TaskStatus.PENDING, Task.due_time >= since, Task.due_time < until)
+        .group_by(Task.source)
+    )
+
+
+async def get_task_stats(db: AsyncSession) -> dict[str, Any]:
+    """
+    Read task counts per status and source from the task_stats table.
+
+    Cost does not depend on the number of tasks: the summary rows are
+    summed, and only the pending tasks that became overdue since the
+    last watermark update are counted from ``tasks``. Everything is read
+    in one statement, so from one snapshot.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        Dict with total, overdue, by_status and by_source (total, overdue
+        and by_status per source), keyed by enum values, with every status
+        and source present
+    """
+    state = select(TaskStatsState.overdue_as_of).where(TaskStatsState.id == 1).scalar_subquery()
+    tail = _overdue_tail(state, func.now()).subquery()
+    query = union_all(
+        select(
+            TaskStatsCounter.status,
+            TaskStatsCounter.source,
+            _sum(TaskStatsCounter.total),
+            _sum(TaskStatsCounter.overdue)
+        ).group_by(TaskStatsCounter.status, TaskStatsCounter.source),
+        select(literal(TaskStatus.PENDING, TaskStatsCounter.status.type), tail.c.source, literal(0), tail.c.overdue)
+    )
+    result = await db.execute(query)
+
+    statuses = [status.value for status in TaskStatus]
+    by_source = {
+        source.value: {"total": 0, "overdue": 0, "by_status": dict.fromkeys(statuses, 0)}
+        for source in TaskSource
+    }
+    for status, source, total, overdue in result:
+        counts = by_source[source.value]
+        counts["total"] += total
+        counts["overdue"] += overdue
+        counts["by_status"][status.value] += total
+
+    return {
+        "total": sum(counts["total"] for counts in by_source.values()),
+        "overdue": sum(counts["overdue"] for counts in by_source.values()),
+        "by_status": {
+            status.value: sum(counts["by_status"][status.value] for counts in by_source.values())
+            for status in TaskStatus
+        },
+        "by_source": by_source,
+    }
+
+
+async def _lock_state(db: AsyncSession) -> TaskStatsState:
+    """
+    Lock the task_stats_state row against the other stats jobs.
+
+    Triggers on tasks read the row without locking it, so this never
+    blocks task writes.
+    """
+    result = await db.execute(select(TaskStatsState).where(TaskStatsState.id == 1).with_for_update())
+    return result.scalar_one()
+
+
+async def advance_overdue(db: AsyncSession) -> int:
+    """
+    Move the overdue watermark to now, counting the tasks that became overdue meanwhile, and commit.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        Number of tasks that became overdue
+    """
+    state = await _lock_state(db)
+    now = await db.scalar(select(func.now()))
+    result = await db.execute(_overdue_tail(state.overdue_as_of, now))
+    rows = [
+        {"status": TaskStatus.PENDING, "source": source, "shard": 0, "total": 0, "overdue": overdue}
+        for source, overdue in result
+    ]
+    if rows:
+        await _add_counts(db, rows)
+    state.overdue_as_of = now
+    await db.commit()
+    return sum(row["overdue"] for row in rows)
+
+
+async def _add_counts(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Add total and overdue deltas to the shard 0 rows, without committing."""
+    stmt = pg_insert(TaskStatsCounter).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["status", "source", "shard"],
+            set_={
+                "total": TaskStatsCounter.total + stmt.excluded.total,
+                "overdue": TaskStatsCounter.overdue + stmt.excluded.overdue,
+            }
+        )
+    )
+
+
+async def reconcile_task_stats(db: AsyncSession, min_interval: timedelta = timedelta(0)) -> int | None:
+    """
+    Recount task_stats from the tasks table and correct any drift, and commit.
+
+    Nothing is locked while counting. Every write updates tasks and
+    task_stats in the same transaction, so in any single snapshot the
+    two agree unless something bypassed the triggers or raced a
+    watermark move. The difference is therefore computed in one
+    statement and added to the counts as a delta; writes committed
+    meanwhile carry their own deltas and stay counted.
+
+    Args:
+        db: Async database session
+        min_interval: Skip the recount if another one ran more recently,
+            e.g. in another worker
+
+    Returns:
+        Sum of the absolute corrections to the total and overdue counts,
+        or None if the recount was skipped
+    """
+    # Claim this run; only other reconciliations wait on the row lock
+    claimed = await db.scalar(
+        update(TaskStatsState)
+        .where(
+            TaskStatsState.id == 1,
+            or_(
+                TaskStatsState.reconciled_at.is_(None),
+                TaskStatsState.reconciled_at <= func.now() - min_interval
+            )
+        )
+        .values(reconciled_at=func.now())
+        .returning(TaskStatsState.id)
+    )
+    await db.commit()
+    if claimed is None:
+        return None
+
+    as_of = select(TaskStatsState.overdue_as_of).where(TaskStatsState.id == 1).scalar_subquery()
+    actual = (
+        select(
+            Task.status,
+            Task.source,
+            func.count().label("total"),
+            func.count().filter(Task.status == TaskStatus.PENDING, Task.due_time < as_of).label("overdue")
+        )
+        .group_by(Task.status, Task.source)
+        .subquery()
+    )
+    counted = (
+        select(
+            TaskStatsCounter.status,
+            TaskStatsCounter.source,
+            _sum(TaskStatsCounter.total).label("total"),
+            _sum(TaskStatsCounter.overdue).label("overdue")
+        )
+        .group_by(TaskStatsCounter.status, TaskStatsCounter.source)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            func.coalesce(actual.c.status, counted.c.status),
+            func.coalesce(actual.c.source, counted.c.source),
+            func.coalesce(actual.c.total, 0) - func.coalesce(counted.c.total, 0),
+            func.coalesce(actual.c.overdue, 0) - func.coalesce(counted.c.overdue, 0)
+        )
+        .select_from(
+            actual.join(
+                counted,
+                and_(actual.c.status == counted.c.status, actual.c.source == counted.c.source),
+                full=True
+            )
+        )
+    )
+    rows = [
+        {"status": status, "source": source, "shard": 0, "total": total, "overdue": overdue}
+        for status, source, total, overdue in result
+        if total or overdue
+    ]
+
+    if rows:
+        await _add_counts(db, rows)
+    await db.commit()
+    return sum(abs(row["total"]) + abs(row["overdue"]) for row in rows)
@@ -3,10 +3,18 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from app.core.cache import task_cache
 from app.core.config import settings
+from app.core.database import engine, get_pool_status, pool_wait_stats
+from app.core.metrics import MetricsMiddleware, http_metrics, render_gauges
+from app.core.query_stats import QueryStatsMiddleware, install_query_hooks
+from app.api.deps import NEXT_CURSOR_HEADER
 from app.api.routes import tasks, reminders
+from app.services.retention import retention_service
 from app.services.scheduler import reminder_scheduler
+from app.services.task_stats import task_stats_service
 
 # Configure logging
 logging.basicConfig(
@@ -26,11 +34,15 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"Starting {settings.APP_NAME}")
     reminder_scheduler.start()
+    retention_service.start()
+    task_stats_service.start()
 
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
+    task_stats_service.stop()
+    retention_service.stop()
     reminder_scheduler.stop()
 
 
@@ -49,8 +61,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Server-Timing"],
 )
 
+# Request metrics for the API routers, exported at /metrics
+app.add_middleware(MetricsMiddleware, path_prefixes=("/tasks", "/reminders"))
+
+# Per-request statement count and DB time (Server-Timing, slow request log)
+install_query_hooks(engine)
+app.add_middleware(QueryStatsMiddleware)
+
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
@@ -64,10 +84,36 @@ async def health_check():
     return {
         "status": "healthy",
         "service": settings.APP_NAME,
-        "environment": settings.APP_ENV
+        "environment": settings.APP_ENV,
+        "task_cache": task_cache.stats(),
+        "db_pool": get_pool_status()
     }
 
 
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    Metrics endpoint in Prometheus text exposition format.
+
+    Returns:
+        Request counters, latency histograms, in-flight requests,
+        connection pool and task cache metrics
+    """
+    pool_status = get_pool_status()
+    gauges = [
+        ("db_pool_checked_out", "gauge", "Connections in use.", lambda: pool_status["checked_out"]),
+        ("db_pool_idle", "gauge", "Idle connections in the pool.", lambda: pool_status["idle"]),
+        ("db_pool_overflow", "gauge", "Overflow connections open.", lambda: pool_status["overflow"]),
+        ("db_pool_acquisitions_total", "counter", "Connection checkouts.", lambda: pool_wait_stats.acquisitions),
+        ("db_pool_wait_seconds_total", "counter", "Time spent waiting for a connection.", lambda: pool_wait_stats.total_wait),
+        ("task_cache_hits_total", "counter", "Task cache hits.", lambda: task_cache.hits),
+        ("task_cache_misses_total", "counter", "Task cache misses.", lambda: task_cache.misses),
+        ("task_cache_evictions_total", "counter", "Task cache evictions.", lambda: task_cache.evictions),
+    ]
+    lines = [*http_metrics.render(), *render_gauges(gauges)]
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+
 # Include routers
 app.include_router(
     tasks.router,
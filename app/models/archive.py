@@ -0,0 +1,70 @@
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Boolean, DateTime, Enum, Index, Interval, String, Text, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.reminder import ReminderChannel
+from app.models.task import TaskSource, TaskStatus
+
+
+class TaskArchive(Base):
+    """Finished task moved out of ``tasks`` by the retention job."""
+
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        # Same orderings as the live table, so include_archived lists can merge both
+        Index("ix_tasks_archive_created_at_id", "created_at", "id"),
+        Index(
+            "ix_tasks_archive_status_created_at_id",
+            "status", text("created_at DESC"), text("id DESC")
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus, native_enum=False), nullable=False)
+    due_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    source: Mapped[TaskSource] = mapped_column(Enum(TaskSource, native_enum=False), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<TaskArchive(id={self.id}, title='{self.title}', status={self.status})>"
+
+
+class ReminderArchive(Base):
+    """Reminder moved out of ``reminders`` by the retention job."""
+
+    __tablename__ = "reminders_archive"
+    __table_args__ = (
+        Index("ix_reminders_archive_remind_at_id", "remind_at", "id"),
+        Index("ix_reminders_archive_task_id", "task_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    # No foreign key: the task may be live or archived
+    task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    remind_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    channel: Mapped[ReminderChannel] = mapped_column(Enum(ReminderChannel, native_enum=False), nullable=False)
+    sent: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    repeat_interval: Mapped[timedelta | None] = mapped_column(Interval, nullable=True)
+    repeat_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    claimed_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<ReminderArchive(id={self.id}, task_id={self.task_id}, remind_at={self.remind_at})>"
@@ -1,9 +1,9 @@
 import enum
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, func, Enum
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Index, Interval, UniqueConstraint, func, Enum, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,26 +21,44 @@ class ReminderChannel(str, enum.Enum):
 
 
 class Reminder(Base):
-    """Reminder model for task notifications."""
+    """
+    Reminder model for task notifications.
+
+    The table is partitioned by month on remind_at (see migration 007), so
+    remind_at is part of the primary key.
+    """
 
     __tablename__ = "reminders"
+    __table_args__ = (
+        # Keyset pagination order for reminder lists
+        Index("ix_reminders_remind_at_id", "remind_at", "id"),
+        # Due-reminder scan: only unsent rows are indexed
+        Index(
+            "ix_reminders_due",
+            "remind_at", "id",
+            postgresql_where=text("sent = false")
+        ),
+        # One reminder per task, time and channel; lets retries be ignored
+        UniqueConstraint(
+            "task_id", "remind_at", "channel",
+            name="uq_reminders_task_id_remind_at_channel"
+        ),
+        {"postgresql_partition_by": "RANGE (remind_at)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        default=uuid.uuid4
     )
     task_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("tasks.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     remind_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
-        index=True
+        primary_key=True
     )
     channel: Mapped[ReminderChannel] = mapped_column(
         Enum(ReminderChannel, native_enum=False),
@@ -49,8 +67,22 @@ class Reminder(Base):
     sent: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
-        nullable=False,
-        index=True
+        nullable=False
+    )
+    # Recurrence: only the next occurrence is stored; it is created when
+    # this one is sent
+    repeat_interval: Mapped[timedelta | None] = mapped_column(
+        Interval,
+        nullable=True
+    )
+    repeat_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+    # Scheduler claim: other workers skip the reminder until this time
+    claimed_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -64,6 +96,28 @@ class Reminder(Base):
         back_populates="reminders"
     )
 
+    def next_occurrence(self, after: datetime) -> datetime | None:
+        """
+        Compute the first occurrence of a recurring reminder after a time.
+
+        Occurrences missed while nothing was running are skipped rather
+        than sent in a burst.
+
+        Args:
+            after: Occurrences at or before this time are skipped
+
+        Returns:
+            Next due time, or None if the reminder does not repeat or the
+            series has ended
+        """
+        if self.repeat_interval is None:
+            return None
+        steps = max((after - self.remind_at) // self.repeat_interval + 1, 1)
+        next_at = self.remind_at + steps * self.repeat_interval
+        if self.repeat_until is not None and next_at > self.repeat_until:
+            return None
+        return next_at
+
     def __repr__(self) -> str:
         return f"<Reminder(id={self.id}, task_id={self.task_id}, remind_at={self.remind_at}, sent={self.sent})>"
 
@@ -3,8 +3,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Text, DateTime, Enum, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Computed, String, Text, DateTime, Enum, Index, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
     from app.models.reminder import Reminder
 
 
+# Text search configuration of Task.search_vector; queries must use the same
+SEARCH_CONFIG = "english"
+
+
 class TaskStatus(str, enum.Enum):
     """Task status enumeration."""
     PENDING = "pending"
@@ -32,25 +36,37 @@ class Task(Base):
     """Task model representing user tasks in the system."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination order for task lists
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        # Status-filtered task lists, newest first
+        Index(
+            "ix_tasks_status_created_at_id",
+            "status", text("created_at DESC"), text("id DESC")
+        ),
+        # Due-time windows and GET /tasks?sort=due_time
+        Index("ix_tasks_due_time_id", "due_time", "id"),
+        # Same, per status; overdue pending tasks
+        Index("ix_tasks_status_due_time_id", "status", "due_time", "id"),
+        # Full-text search
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        default=uuid.uuid4
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[TaskStatus] = mapped_column(
         Enum(TaskStatus, native_enum=False),
         default=TaskStatus.PENDING,
-        nullable=False,
-        index=True
+        nullable=False
     )
     due_time: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
-        nullable=True,
-        index=True
+        nullable=True
     )
     source: Mapped[TaskSource] = mapped_column(
         Enum(TaskSource, native_enum=False),
@@ -68,12 +84,24 @@ class Task(Base):
         onupdate=func.now(),
         nullable=False
     )
+    # Maintained by Postgres; title matches rank above description matches.
+    # Deferred so that loading tasks never fetches it.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        deferred=True
+    )
 
     # Relationships
     reminders: Mapped[list["Reminder"]] = relationship(
         "Reminder",
         back_populates="task",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        order_by="(Reminder.remind_at, Reminder.id)"
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, Enum, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.task import TaskSource, TaskStatus
+
+
+class TaskStatsCounter(Base):
+    """
+    Task counts for one (status, source) pair, maintained by triggers on ``tasks``.
+
+    Each pair is split over several shards, picked by backend PID in the
+    trigger, so concurrent writers rarely update the same row; readers
+    sum the shards. See migration 008.
+    """
+
+    __tablename__ = "task_stats"
+
+    status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus, native_enum=False), primary_key=True)
+    source: Mapped[TaskSource] = mapped_column(Enum(TaskSource, native_enum=False), primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # Pending tasks due before task_stats_state.overdue_as_of
+    overdue: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<TaskStatsCounter(status={self.status}, source={self.source}, shard={self.shard}, total={self.total})>"
+
+
+class TaskStatsState(Base):
+    """Single-row bookkeeping for task_stats."""
+
+    __tablename__ = "task_stats_state"
+    __table_args__ = (
+        CheckConstraint("id = 1", name="ck_task_stats_state_single_row"),
+    )
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=1)
+    # task_stats.overdue counts pending tasks due before this time
+    overdue_as_of: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    reconciled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<TaskStatsState(overdue_as_of={self.overdue_as_of}, reconciled_at={self.reconciled_at})>"
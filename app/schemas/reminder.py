@@ -1,7 +1,9 @@
-from datetime import datetime
+import enum
+from datetime import datetime, timedelta
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from app.models.reminder import ReminderChannel
 
@@ -12,6 +14,18 @@ class ReminderBase(BaseModel):
     task_id: UUID
     remind_at: datetime
     channel: ReminderChannel
+    repeat_interval: Optional[timedelta] = Field(None, ge=timedelta(minutes=1))
+    repeat_until: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def check_recurrence(self) -> "ReminderBase":
+        """Reject an end date without an interval, or before the first occurrence."""
+        if self.repeat_until is not None:
+            if self.repeat_interval is None:
+                raise ValueError("repeat_until requires repeat_interval")
+            if self.repeat_until < self.remind_at:
+                raise ValueError("repeat_until must not be before remind_at")
+        return self
 
 
 class ReminderCreate(ReminderBase):
@@ -32,3 +46,35 @@ class Reminder(ReminderInDB):
     """Public reminder schema returned by API."""
     pass
 
+
+class ReminderBulkStatus(str, enum.Enum):
+    """Outcome of one item in a bulk reminder creation."""
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    TASK_NOT_FOUND = "task_not_found"
+
+
+class ReminderBulkItem(BaseModel):
+    """Per-item result of a bulk reminder creation."""
+    index: int
+    status: ReminderBulkStatus
+    reminder: Optional[Reminder] = None
+
+
+class ReminderBulkResult(BaseModel):
+    """Result of a bulk reminder creation, in request order."""
+    created: int
+    duplicates: int
+    task_not_found: int
+    items: List[ReminderBulkItem]
+
+
+class ReminderBatchGet(BaseModel):
+    """IDs of the reminders to fetch in one call."""
+    ids: List[UUID]
+
+
+class ReminderBatchGetResult(BaseModel):
+    """Reminders found, in request order, and the requested IDs that do not exist."""
+    items: List[Reminder]
+    missing: List[UUID]
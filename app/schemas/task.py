@@ -1,10 +1,23 @@
+import enum
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
 from app.models.task import TaskStatus, TaskSource
+from app.schemas.reminder import Reminder
+
+
+class TaskSort(str, enum.Enum):
+    """Sort orders of task lists."""
+    CREATED_AT = "created_at"
+    DUE_TIME = "due_time"
+
+
+class TaskInclude(str, enum.Enum):
+    """Related objects that can be embedded in task responses."""
+    REMINDERS = "reminders"
 
 
 # Base schemas
@@ -43,3 +56,50 @@ class Task(TaskInDB):
     """Public task schema returned by API."""
     pass
 
+
+class TaskWithReminders(Task):
+    """Task with its reminders, ordered by remind_at."""
+    reminders: List[Reminder]
+
+
+class TaskSearchResult(Task):
+    """Task matching a search query, with its relevance."""
+    rank: float
+
+
+class TaskBulkItem(BaseModel):
+    """Per-item result of a bulk task creation."""
+    index: int
+    task: Task
+
+
+class TaskBulkResult(BaseModel):
+    """Result of a bulk task creation, in request order."""
+    created: int
+    items: List[TaskBulkItem]
+
+
+class TaskBatchGet(BaseModel):
+    """IDs of the tasks to fetch in one call."""
+    ids: List[UUID]
+
+
+class TaskBatchGetResult(BaseModel):
+    """Tasks found, in request order, and the requested IDs that do not exist."""
+    items: List[Task]
+    missing: List[UUID]
+
+
+class TaskSourceStats(BaseModel):
+    """Task counts for one source."""
+    total: int
+    overdue: int
+    by_status: Dict[str, int] = Field(..., description="Count per TaskStatus value")
+
+
+class TaskStats(BaseModel):
+    """Task counts per status and source; overdue counts pending tasks past their due time."""
+    total: int
+    overdue: int
+    by_status: Dict[str, int] = Field(..., description="Count per TaskStatus value")
+    by_source: Dict[str, TaskSourceStats] = Field(..., description="Counts per TaskSource value")
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Sequence
+from uuid import UUID
+
+from app.core.config import settings
+from app.models.reminder import Reminder, ReminderChannel
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationSender(ABC):
+    """Delivers reminders over a single channel."""
+
+    @abstractmethod
+    async def send(self, reminder: Reminder) -> None:
+        """
+        Deliver one reminder.
+
+        Args:
+            reminder: Reminder to deliver
+
+        Raises:
+            Exception: If delivery failed; the reminder stays unsent
+        """
+
+
+class LoggingSender(NotificationSender):
+    """Sender that only logs reminders. Default until real integrations exist."""
+
+    async def send(self, reminder: Reminder) -> None:
+        logger.info(
+            f"Reminder {reminder.id} for task {reminder.task_id} "
+            f"via {reminder.channel.value} - Due at {reminder.remind_at}"
+        )
+
+
+class StubSender(NotificationSender):
+    """
+    Sender that simulates a remote messaging API.
+
+    Used to load-test dispatch throughput without calling real services.
+    """
+
+    def __init__(self, latency: float, failure_rate: float = 0.0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+
+    async def send(self, reminder: Reminder) -> None:
+        await asyncio.sleep(self.latency)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise RuntimeError(f"Simulated delivery failure for reminder {reminder.id}")
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    The bucket lives in one process: N processes with a bucket each send
+    at up to N times ``rate`` together.
+
+    Raises:
+        ValueError: If ``rate`` is not positive
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ChannelDispatcher:
+    """
+    Sends reminders for one channel through a bounded pool of workers.
+
+    Every send first takes a token from the channel's rate limiter, so a
+    channel never exceeds its own rate however large its backlog is. The
+    limit applies to this process only; see build_dispatchers.
+    """
+
+    def __init__(self, sender: NotificationSender, rate_limit: float, workers: int):
+        self.sender = sender
+        self.bucket = TokenBucket(rate_limit)
+        self.workers = workers
+
+    async def dispatch(self, reminders: Sequence[Reminder]) -> list[UUID]:
+        """
+        Send a batch of reminders.
+
+        Args:
+            reminders: Reminders to send, all for this channel
+
+        Returns:
+            IDs of the reminders that were delivered
+        """
+        queue: asyncio.Queue[Reminder] = asyncio.Queue()
+        for reminder in reminders:
+            queue.put_nowait(reminder)
+        delivered: list[UUID] = []
+
+        async def worker() -> None:
+            while not queue.empty():
+                reminder = queue.get_nowait()
+                await self.bucket.acquire()
+                try:
+                    await self.sender.send(reminder)
+                    delivered.append(reminder.id)
+                except Exception as e:
+                    logger.warning(f"Failed to send reminder {reminder.id}: {e}")
+
+        await asyncio.gather(*(worker() for _ in range(min(self.workers, len(reminders)))))
+        return delivered
+
+
+def build_sender() -> NotificationSender:
+    """Build the sender selected by NOTIFICATION_SENDER."""
+    if settings.NOTIFICATION_SENDER == "stub":
+        return StubSender(latency=settings.NOTIFICATION_STUB_LATENCY_MS / 1000)
+    return LoggingSender()
+
+
+def build_dispatchers() -> dict[ReminderChannel, ChannelDispatcher]:
+    """
+    Build one dispatcher per reminder channel from settings.
+
+    Every worker process runs its own scheduler and dispatchers, so the
+    configured per-channel rates are split evenly across WEB_CONCURRENCY
+    workers to keep the combined rate within the limit.
+    """
+    rate_limits = {
+        ReminderChannel.TELEGRAM: settings.TELEGRAM_RATE_LIMIT,
+        ReminderChannel.WHATSAPP: settings.WHATSAPP_RATE_LIMIT,
+        ReminderChannel.UI: settings.UI_RATE_LIMIT,
+    }
+    return {
+        channel: ChannelDispatcher(
+            sender=build_sender(),
+            rate_limit=rate_limit / settings.WEB_CONCURRENCY,
+            workers=settings.NOTIFICATION_WORKERS_PER_CHANNEL
+        )
+        for channel, rate_limit in rate_limits.items()
+    }
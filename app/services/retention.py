@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.crud.archive import archive_finished_tasks, archive_sent_reminders
+from app.crud.reminder import drop_reminder_partitions
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionService:
+    """
+    Service that moves old rows out of the live tables.
+
+    Every ``interval``, sent reminders due more than ``retention`` ago
+    and completed or cancelled tasks last updated more than ``retention``
+    ago (with all their reminders) are moved to the archive tables, or
+    deleted when ``mode`` is "delete". Rows are moved ``batch_size`` at a
+    time, one short transaction per batch, so the locks taken never block
+    the API or the scheduler for long. Batches are claimed with SKIP
+    LOCKED, so every worker process can run its own instance.
+
+    Monthly reminders partitions past the retention period are detached
+    and dropped as a whole: in "delete" mode before the row batches, as
+    soon as they hold no unsent reminders; in "archive" mode once their
+    rows have all been archived.
+    """
+
+    def __init__(
+        self,
+        mode: str = settings.RETENTION_MODE,
+        retention: timedelta = timedelta(days=settings.RETENTION_DAYS),
+        batch_size: int = settings.RETENTION_BATCH_SIZE,
+        interval: timedelta = timedelta(seconds=settings.RETENTION_INTERVAL_SECONDS)
+    ):
+        self.mode = mode
+        self.retention = retention
+        self.batch_size = batch_size
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+        self._is_running = False
+
+    async def run_once(self) -> tuple[int, int]:
+        """
+        Move everything currently past the retention period.
+
+        Returns:
+            Tuple of (tasks moved, reminders moved), not counting rows
+            removed with dropped partitions
+        """
+        cutoff = datetime.now(timezone.utc) - self.retention
+        archive = self.mode == "archive"
+        tasks = reminders = 0
+
+        if not archive:
+            await self._drop_partitions(cutoff, require_empty=False)
+
+        while True:
+            async with AsyncSessionLocal() as db:
+                moved = await archive_sent_reminders(
+                    db=db,
+                    sent_before=cutoff,
+                    limit=self.batch_size,
+                    archive=archive
+                )
+            reminders += moved
+            if moved < self.batch_size:
+                break
+
+        while True:
+            async with AsyncSessionLocal() as db:
+                moved, moved_reminders = await archive_finished_tasks(
+                    db=db,
+                    finished_before=cutoff,
+                    limit=self.batch_size,
+                    archive=archive
+                )
+            tasks += moved
+            reminders += moved_reminders
+            if moved < self.batch_size:
+                break
+
+        if tasks or reminders:
+            action = "archived" if archive else "deleted"
+            logger.info(f"Retention: {action} {tasks} task(s) and {reminders} reminder(s)")
+
+        if archive:
+            await self._drop_partitions(cutoff, require_empty=True)
+        return tasks, reminders
+
+    async def _drop_partitions(self, cutoff: datetime, require_empty: bool) -> None:
+        """Drop the reminders partitions that ended before ``cutoff``."""
+        async with AsyncSessionLocal() as db:
+            dropped = await drop_reminder_partitions(db=db, before=cutoff, require_empty=require_empty)
+        if dropped:
+            logger.info(f"Retention: dropped reminders partition(s) {', '.join(dropped)}")
+
+    async def _run(self) -> None:
+        """Apply the retention policy, sleep for ``interval``, repeat."""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in retention job: {e}", exc_info=True)
+            await asyncio.sleep(self.interval.total_seconds())
+
+    def start(self) -> None:
+        """Start the retention service, unless mode is "off". Must be called from a running event loop."""
+        if self.mode != "off" and not self._is_running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self._is_running = True
+            logger.info(f"Retention service started ({self.mode} after {self.retention.days} days)")
+
+    def stop(self) -> None:
+        """Stop the retention service."""
+        if self._is_running:
+            self._task.cancel()
+            self._task = None
+            self._is_running = False
+            logger.info("Retention service stopped")
+
+
+# Global retention instance
+retention_service = RetentionService()
@@ -1,11 +1,24 @@
+import asyncio
+import heapq
 import logging
-from datetime import datetime, timezone
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy.ext.asyncio import AsyncSession
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
 
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
-from app.crud.reminder import get_pending_reminders
+from app.crud.reminder import (
+    claim_due_reminders,
+    claim_stale_reminders,
+    count_due_reminders,
+    create_next_occurrences,
+    create_reminder_partitions,
+    get_upcoming_remind_times,
+    mark_reminders_sent,
+    release_reminders,
+)
+from app.models.reminder import ReminderChannel
+from app.services.notifications import ChannelDispatcher, build_dispatchers
 
 logger = logging.getLogger(__name__)
 
@@ -14,72 +27,380 @@ class ReminderSchedulerService:
     """
     Service for scheduling and processing reminders.
 
-    This service runs periodically to check for pending reminders
-    and process them. Currently logs reminders; can be extended
-    to integrate with messaging services.
+    The service keeps a min-heap of the due times of upcoming reminders
+    (the next ``window`` worth, at most ``window_max_items`` of them) and
+    sleeps exactly until the earliest one, instead of polling. The window
+    is reloaded from the database when it runs out, or when the API
+    reports that reminders were deleted.
+    Delivery goes through one ChannelDispatcher per channel; the
+    default sender only logs reminders. A recurring reminder is stored
+    as a single row; its next occurrence is created when it is sent.
+
+    Due reminders are claimed in batches with FOR UPDATE SKIP LOCKED
+    and leased for ``claim_lease``; the claim commits before the batch
+    is sent, so no transaction stays open during delivery. Every worker
+    process can run its own instance safely: each batch is handled by
+    exactly one worker, unless its lease expires before it is marked
+    sent.
+
+    On start, the backlog left by downtime is drained first (catch-up
+    mode), applying ``stale_policy`` to reminders more than
+    ``stale_after`` late.
+
+    The monthly partitions of the reminders table are created
+    ``partition_months_ahead`` months in advance, on start and then
+    every PARTITION_CHECK_INTERVAL seconds.
     """
 
-    def __init__(self):
-        self.scheduler = AsyncIOScheduler()
+    # Seconds between catch-up progress log lines
+    CATCH_UP_PROGRESS_INTERVAL = 10.0
+    # Seconds between checks for missing future partitions
+    PARTITION_CHECK_INTERVAL = 3600.0
+    # Pause after a pass that delivered nothing (other workers claimed
+    # everything, or every send failed), so a reloaded window of
+    # reminders that keep failing cannot spin the loop
+    IDLE_PASS_BACKOFF = 1.0
+
+    def __init__(
+        self,
+        batch_size: int = settings.REMINDER_BATCH_SIZE,
+        window: timedelta = timedelta(seconds=settings.REMINDER_WINDOW_SECONDS),
+        window_max_items: int = settings.REMINDER_WINDOW_MAX_ITEMS,
+        retry_delay: timedelta = timedelta(seconds=settings.REMINDER_RETRY_SECONDS),
+        claim_lease: timedelta = timedelta(seconds=settings.REMINDER_CLAIM_LEASE_SECONDS),
+        dispatchers: dict[ReminderChannel, ChannelDispatcher] | None = None,
+        stale_policy: str = settings.REMINDER_STALE_POLICY,
+        stale_after: timedelta = timedelta(hours=settings.REMINDER_STALE_AFTER_HOURS),
+        partition_months_ahead: int = settings.REMINDER_PARTITION_MONTHS_AHEAD
+    ):
+        self.batch_size = batch_size
+        self.dispatchers = dispatchers if dispatchers is not None else build_dispatchers()
+        self.window = window
+        self.window_max_items = window_max_items
+        self.retry_delay = retry_delay
+        self.claim_lease = claim_lease
+        self.stale_policy = stale_policy
+        self.stale_after = stale_after
+        self.partition_months_ahead = partition_months_ahead
+        self._partitions_checked_at: float | None = None
+        self._delivered_total = 0
+        self._heap: list[datetime] = []
+        # None while the window is not loaded or being reloaded
+        self._window_end: datetime | None = None
+        # Times pushed while _window_end is None, merged by _refill_window
+        self._pushed: list[datetime] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
         self._is_running = False
 
-    async def process_pending_reminders(self) -> None:
+    def reminders_scheduled(self, remind_times: Iterable[datetime]) -> None:
         """
-        Check for and process pending reminders.
+        Register newly created reminders with the in-memory window.
+
+        Times inside the loaded window are pushed onto the heap and the
+        timer is re-armed, so short-notice reminders fire on time. Later
+        times are picked up when the window is reloaded. While the window
+        is being (re)loaded, times are buffered and merged into the new
+        window, since the reload query may not see the new rows.
 
-        Fetches all unsent reminders that are due and logs them.
-        In production, this would trigger actual notifications via
-        Telegram, WhatsApp, or other channels.
+        Args:
+            remind_times: Due times of the new reminders
         """
+        if self._window_end is None:
+            if self._is_running:
+                self._pushed.extend(remind_times)
+            return
+        pushed = False
+        for remind_at in remind_times:
+            if remind_at < self._window_end:
+                heapq.heappush(self._heap, remind_at)
+                pushed = True
+        if pushed:
+            self._wakeup.set()
+
+    def invalidate(self) -> None:
+        """Drop the in-memory window so it is reloaded on the next wake-up."""
+        self._window_end = None
+        self._wakeup.set()
+
+    async def _refill_window(self) -> None:
+        """Load the due times of the upcoming window from the database."""
+        # Buffer times pushed by the API until the new window is in place
+        self._window_end = None
+        window_end = datetime.now(timezone.utc) + self.window
         async with AsyncSessionLocal() as db:
-            try:
-                current_time = datetime.now(timezone.utc)
-                pending_reminders = await get_pending_reminders(
+            remind_times = await get_upcoming_remind_times(
+                db=db,
+                until=window_end,
+                limit=self.window_max_items
+            )
+
+        if len(remind_times) == self.window_max_items:
+            # Window is truncated; reload once its last entry is reached
+            window_end = remind_times[-1]
+
+        # Keep times pushed by the API before and while the query was running
+        heap = set(remind_times)
+        heap.update(remind_at for remind_at in self._heap if remind_at < window_end)
+        heap.update(remind_at for remind_at in self._pushed if remind_at < window_end)
+        self._pushed.clear()
+        self._heap = list(heap)
+        heapq.heapify(self._heap)
+        self._window_end = window_end
+
+    async def ensure_partitions(self) -> None:
+        """Create missing reminders partitions for the coming months; errors are logged."""
+        self._partitions_checked_at = time.monotonic()
+        try:
+            async with AsyncSessionLocal() as db:
+                created = await create_reminder_partitions(db=db, months_ahead=self.partition_months_ahead)
+        except Exception as e:
+            # Retried at the next check; reminders land in the default partition meanwhile
+            logger.error(f"Error creating reminders partitions: {e}", exc_info=True)
+            return
+        if created:
+            logger.info(f"Created reminders partition(s): {', '.join(created)}")
+
+    async def catch_up(self) -> int:
+        """
+        Drain the backlog of overdue reminders left by downtime.
+
+        Reminders more than ``stale_after`` late are handled according to
+        ``stale_policy`` first: "skip" drops all of them, "coalesce" drops
+        those superseded by a later due reminder for the same task and
+        channel, "send" keeps them. Dropped reminders are marked sent
+        without being delivered (recurring ones still get their next
+        occurrence). The rest is then delivered oldest first, in batches,
+        with progress logged every CATCH_UP_PROGRESS_INTERVAL seconds.
+
+        Returns:
+            Number of reminders delivered
+        """
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            backlog, oldest = await count_due_reminders(db=db, current_time=now)
+        if not backlog:
+            return 0
+
+        start = time.perf_counter()
+        logger.info(
+            f"Catch-up: {backlog} overdue reminder(s), "
+            f"oldest {(now - oldest).total_seconds() / 3600:.1f}h late"
+        )
+
+        dropped = 0
+        if self.stale_policy != "send" and now - oldest > self.stale_after:
+            dropped = await self._drop_stale(
+                stale_before=now - self.stale_after,
+                current_time=now,
+                superseded_only=self.stale_policy == "coalesce"
+            )
+            logger.info(
+                f"Catch-up: dropped {dropped} reminder(s) more than "
+                f"{self.stale_after.total_seconds() / 3600:g}h late ({self.stale_policy} policy)"
+            )
+
+        reporter = asyncio.get_running_loop().create_task(
+            self._report_progress(self._delivered_total, backlog - dropped)
+        )
+        try:
+            delivered = await self.process_pending_reminders()
+        finally:
+            reporter.cancel()
+
+        logger.info(
+            f"Catch-up finished in {time.perf_counter() - start:.1f}s: "
+            f"{delivered} delivered, {dropped} dropped"
+        )
+        return delivered
+
+    async def _drop_stale(self, stale_before: datetime, current_time: datetime, superseded_only: bool) -> int:
+        """Mark stale reminders sent without delivering them, batch by batch."""
+        dropped = 0
+        while True:
+            async with AsyncSessionLocal() as db:
+                batch = await claim_stale_reminders(
                     db=db,
-                    current_time=current_time
+                    stale_before=stale_before,
+                    current_time=current_time,
+                    limit=self.batch_size,
+                    superseded_only=superseded_only
                 )
+                if not batch:
+                    break
+                next_times = await create_next_occurrences(db=db, reminders=batch, after=current_time)
+                await mark_reminders_sent(db, [reminder.id for reminder in batch])
+                self.reminders_scheduled(next_times)
 
-                if pending_reminders:
-                    logger.info(f"Found {len(pending_reminders)} pending reminder(s)")
+            dropped += len(batch)
+            if len(batch) < self.batch_size:
+                break
+        return dropped
 
-                    for reminder in pending_reminders:
-                        logger.info(
-                            f"Reminder {reminder.id} for task {reminder.task_id} "
-                            f"via {reminder.channel.value} - Due at {reminder.remind_at}"
-                        )
-                        # TODO: Implement actual notification sending
-                        # await self._send_notification(reminder)
+    async def _report_progress(self, delivered_before: int, backlog: int) -> None:
+        """Log catch-up progress periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.CATCH_UP_PROGRESS_INTERVAL)
+            logger.info(f"Catch-up: {self._delivered_total - delivered_before}/{backlog} delivered")
 
-                        # Mark as sent (uncomment when notifications are implemented)
-                        # reminder.sent = True
+    async def _run(self) -> None:
+        """Drain the backlog, then sleep until the next due reminder, process, repeat."""
+        try:
+            await self.ensure_partitions()
+            await self.catch_up()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error in reminder catch-up: {e}", exc_info=True)
 
-                    # await db.commit()
-                else:
-                    logger.debug("No pending reminders found")
+        while True:
+            try:
+                self._wakeup.clear()
+                now = datetime.now(timezone.utc)
+                if self._window_end is None or now >= self._window_end:
+                    if time.monotonic() - self._partitions_checked_at >= self.PARTITION_CHECK_INTERVAL:
+                        await self.ensure_partitions()
+                    await self._refill_window()
+                    now = datetime.now(timezone.utc)
+
+                if self._heap and self._heap[0] <= now:
+                    delivered = await self.process_pending_reminders()
+                    while self._heap and self._heap[0] <= now:
+                        heapq.heappop(self._heap)
+                    if not delivered:
+                        await asyncio.sleep(self.IDLE_PASS_BACKOFF)
+                    continue
+
+                next_at = min(self._heap[0], self._window_end) if self._heap else self._window_end
+                timeout = max((next_at - now).total_seconds(), 0)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in reminder scheduler loop: {e}", exc_info=True)
+                self._window_end = None
+                await asyncio.sleep(5)
+
+    async def process_pending_reminders(self) -> int:
+        """
+        Claim and process pending reminders until none are left.
+
+        Each channel is drained concurrently by its own loop, dispatcher
+        and rate limit, so a backlog on one channel cannot delay the
+        others.
+
+        Returns:
+            Number of reminders delivered
+        """
+        current_time = datetime.now(timezone.utc)
+        delivered = await asyncio.gather(*(
+            self._drain_channel(channel, dispatcher, current_time)
+            for channel, dispatcher in self.dispatchers.items()
+        ))
+        processed = sum(delivered)
+
+        if processed:
+            logger.info(f"Processed {processed} pending reminder(s)")
+        else:
+            logger.debug("No pending reminders found")
+        return processed
+
+    async def _drain_channel(
+        self,
+        channel: ReminderChannel,
+        dispatcher: ChannelDispatcher,
+        current_time: datetime
+    ) -> int:
+        """
+        Claim and dispatch due reminders of one channel until none are left.
+
+        Reminders due at ``current_time`` are claimed in batches of
+        ``batch_size``, dispatched and marked sent. The claim commits
+        before dispatch, so neither a transaction nor a pooled connection
+        is held while sending, and memory stays bounded however large
+        the backlog is. Reminders that fail to send stay unsent and their
+        claim is shortened to ``retry_delay``, which keeps them out of the
+        rest of this run; a wake-up is scheduled to try them again. For
+        delivered recurring reminders, the next occurrence is created in
+        the transaction that marks them sent.
+
+        Args:
+            channel: Channel to drain
+            dispatcher: Dispatcher for the channel
+            current_time: Reminders due at or before this time are processed
+
+        Returns:
+            Number of reminders delivered
+        """
+        delivered = 0
+        failed = False
+
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    batch = await claim_due_reminders(
+                        db=db,
+                        current_time=current_time,
+                        limit=self.batch_size,
+                        lease_until=datetime.now(timezone.utc) + self.claim_lease,
+                        channel=channel
+                    )
+                if not batch:
+                    break
+
+                sent_ids = await dispatcher.dispatch(batch)
+                sent = set(sent_ids)
+                failed_ids = [reminder.id for reminder in batch if reminder.id not in sent]
+
+                async with AsyncSessionLocal() as db:
+                    if sent_ids:
+                        next_times = await create_next_occurrences(
+                            db=db,
+                            reminders=[reminder for reminder in batch if reminder.id in sent],
+                            after=datetime.now(timezone.utc)
+                        )
+                        await mark_reminders_sent(db, sent_ids)
+                        self.reminders_scheduled(next_times)
+                    if failed_ids:
+                        await release_reminders(
+                            db,
+                            failed_ids,
+                            retry_at=datetime.now(timezone.utc) + self.retry_delay
+                        )
+                        failed = True
+                delivered += len(sent_ids)
+                self._delivered_total += len(sent_ids)
 
             except Exception as e:
-                logger.error(f"Error processing reminders: {e}", exc_info=True)
-                await db.rollback()
+                # Claimed reminders become claimable again when their lease expires
+                logger.error(f"Error processing {channel.value} reminders: {e}", exc_info=True)
+                break
+
+            if len(batch) < self.batch_size:
+                break
+
+        if failed:
+            self.reminders_scheduled([datetime.now(timezone.utc) + self.retry_delay])
+        return delivered
 
     def start(self) -> None:
-        """Start the scheduler service."""
+        """Start the scheduler service. Must be called from a running event loop."""
         if not self._is_running:
-            # Run every minute
-            self.scheduler.add_job(
-                self.process_pending_reminders,
-                'interval',
-                minutes=1,
-                id='process_reminders',
-                replace_existing=True
-            )
-            self.scheduler.start()
+            self._window_end = None
+            self._pushed.clear()
+            self._task = asyncio.get_running_loop().create_task(self._run())
             self._is_running = True
             logger.info("Reminder scheduler service started")
 
     def stop(self) -> None:
         """Stop the scheduler service."""
         if self._is_running:
-            self.scheduler.shutdown()
+            self._task.cancel()
+            self._task = None
             self._is_running = False
             logger.info("Reminder scheduler service stopped")
 
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.crud.task_stats import advance_overdue, reconcile_task_stats
+
+logger = logging.getLogger(__name__)
+
+
+class TaskStatsService:
+    """
+    Service that keeps the task_stats summary table current.
+
+    Triggers on ``tasks`` apply every write to task_stats as it happens;
+    overdue counts also change as time passes, so every
+    ``overdue_interval`` the overdue watermark is moved forward. Every
+    ``reconcile_interval`` the counts are recounted from ``tasks`` and any
+    drift is corrected and logged; with several workers, only one recounts
+    per interval. Neither job blocks task writes.
+    """
+
+    def __init__(
+        self,
+        overdue_interval: timedelta = timedelta(seconds=settings.TASK_STATS_OVERDUE_INTERVAL_SECONDS),
+        reconcile_interval: timedelta = timedelta(seconds=settings.TASK_STATS_RECONCILE_INTERVAL_SECONDS)
+    ):
+        self.overdue_interval = overdue_interval
+        self.reconcile_interval = reconcile_interval
+        self._reconciled_at = time.monotonic()
+        self._task: asyncio.Task | None = None
+        self._is_running = False
+
+    async def reconcile(self) -> int | None:
+        """
+        Recount task_stats unless another worker did it within ``reconcile_interval``.
+
+        Returns:
+            Total drift corrected, or None if skipped
+        """
+        self._reconciled_at = time.monotonic()
+        async with AsyncSessionLocal() as db:
+            drift = await reconcile_task_stats(db=db, min_interval=self.reconcile_interval)
+        if drift:
+            logger.warning(f"Task stats: reconciliation corrected a drift of {drift} task(s)")
+        return drift
+
+    async def _run(self) -> None:
+        """Move the overdue watermark every interval, reconciling when due."""
+        while True:
+            try:
+                if time.monotonic() - self._reconciled_at >= self.reconcile_interval.total_seconds():
+                    await self.reconcile()
+                else:
+                    async with AsyncSessionLocal() as db:
+                        await advance_overdue(db=db)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in task stats job: {e}", exc_info=True)
+            await asyncio.sleep(self.overdue_interval.total_seconds())
+
+    def start(self) -> None:
+        """Start the task stats service. Must be called from a running event loop."""
+        if not self._is_running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self._is_running = True
+            logger.info("Task stats service started")
+
+    def stop(self) -> None:
+        """Stop the task stats service."""
+        if self._is_running:
+            self._task.cancel()
+            self._task = None
+            self._is_running = False
+            logger.info("Task stats service stopped")
+
+
+# Global task stats instance
+task_stats_service = TaskStatsService()
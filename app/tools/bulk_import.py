@@ -0,0 +1,358 @@
+"""
+Bulk import of tasks and reminders through Postgres COPY.
+
+    python -m app.tools.bulk_import tasks.ndjson --reminders reminders.csv
+
+Input files are NDJSON (``.ndjson``/``.jsonl``) or CSV (``.csv``) and
+are read line by line, so memory does not grow with the file size.
+
+Task rows take the TaskCreate fields, plus an optional ``created_at``
+and an optional ``ref`` (the row's ID in the source system). NDJSON task
+rows may embed their reminders as a ``reminders`` list. Reminder rows
+take the ReminderCreate fields plus an optional ``sent`` flag; they may
+name their task by ``task_ref`` (a ``ref`` from the tasks file) instead
+of ``task_id``.
+
+Rows are validated and loaded in chunks, one COPY and one transaction
+per chunk. Reminders that already exist are skipped. Rejected rows are
+written with their errors to an NDJSON error file.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional, TextIO
+from uuid import UUID
+
+import asyncpg
+from pydantic import ValidationError
+
+from app.core.database import engine
+from app.schemas.reminder import ReminderCreate
+from app.schemas.task import TaskCreate
+
+TASK_COLUMNS = ["id", "title", "description", "status", "due_time", "source", "created_at", "updated_at"]
+REMINDER_COLUMNS = [
+    "id", "task_id", "remind_at", "channel", "sent", "repeat_interval", "repeat_until", "created_at"
+]
+
+_REMINDER_COLUMN_LIST = ", ".join(REMINDER_COLUMNS)
+# Reminders go through a staging table so duplicates are skipped instead of failing the chunk
+_CREATE_STAGING = (
+    "CREATE TEMP TABLE IF NOT EXISTS reminders_import "
+    "(LIKE reminders INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+)
+_INSERT_STAGED = (
+    f"INSERT INTO reminders ({_REMINDER_COLUMN_LIST}) "
+    f"SELECT {_REMINDER_COLUMN_LIST} FROM reminders_import "
+    "ON CONFLICT DO NOTHING RETURNING id"
+)
+
+
+class TaskImport(TaskCreate):
+    """Task row of an import file."""
+    ref: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class ReminderImport(ReminderCreate):
+    """Reminder row of an import file, after its task is resolved."""
+    sent: bool = False
+
+
+def read_rows(path: Path) -> Iterator[tuple[int, Any]]:
+    """
+    Stream the rows of an NDJSON or CSV file.
+
+    Args:
+        path: Input file; the format is taken from its extension
+
+    Yields:
+        (line number, row) pairs. Rows are dicts, or the raw line if it
+        is not valid JSON. Empty CSV cells are left out.
+    """
+    with path.open(newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {key: value for key, value in row.items() if value not in ("", None)}
+            return
+
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except json.JSONDecodeError:
+                yield line_no, line.rstrip("\n")
+
+
+def _error_messages(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" if detail["loc"] else detail["msg"]
+        for detail in error.errors()
+    ]
+
+
+class ErrorFile:
+    """NDJSON file of rejected rows, created on the first rejection."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self._file: TextIO | None = None
+
+    def write(self, source: Path, line: int, row: Any, errors: list[str]) -> None:
+        if self._file is None:
+            self._file = self.path.open("w", encoding="utf-8")
+        self._file.write(json.dumps(
+            {"file": str(source), "line": line, "row": row, "errors": errors},
+            default=str
+        ) + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class BulkImporter:
+    """
+    Loads validated chunks of tasks and reminders over one connection.
+
+    Args:
+        pg: asyncpg connection
+        errors: Destination of rejected rows
+        chunk_size: Rows per COPY
+        keep_refs: Remember task ``ref`` -> ID for a reminders file
+    """
+
+    def __init__(self, pg: asyncpg.Connection, errors: ErrorFile, chunk_size: int, keep_refs: bool):
+        self.pg = pg
+        self.errors = errors
+        self.chunk_size = chunk_size
+        self.keep_refs = keep_refs
+        self.refs: dict[str, UUID] = {}
+        self.tasks = 0
+        self.reminders = 0
+        self.duplicates = 0
+
+    async def import_tasks(self, path: Path) -> None:
+        """Validate and load a tasks file, with any embedded reminders."""
+        chunk: list[tuple[int, Any, UUID, TaskImport, list[ReminderImport]]] = []
+        for line, row in read_rows(path):
+            if not isinstance(row, dict):
+                self.errors.write(path, line, row, ["row is not a JSON object"])
+                continue
+
+            task_id = uuid.uuid4()
+            try:
+                task = TaskImport.model_validate(row)
+            except ValidationError as e:
+                self.errors.write(path, line, row, _error_messages(e))
+                continue
+
+            reminders, errors = [], []
+            for index, reminder in enumerate(row.get("reminders") or []):
+                try:
+                    reminders.append(ReminderImport.model_validate({**reminder, "task_id": task_id}))
+                except (ValidationError, TypeError) as e:
+                    messages = _error_messages(e) if isinstance(e, ValidationError) else [str(e)]
+                    errors.extend(f"reminders.{index}.{message}" for message in messages)
+            if errors:
+                self.errors.write(path, line, row, errors)
+                continue
+
+            chunk.append((line, row, task_id, task, reminders))
+            if len(chunk) >= self.chunk_size:
+                await self._load_tasks(path, chunk)
+                chunk = []
+        if chunk:
+            await self._load_tasks(path, chunk)
+
+    async def import_reminders(self, path: Path) -> None:
+        """Validate and load a reminders file."""
+        chunk: list[tuple[int, Any, ReminderImport]] = []
+        for line, row in read_rows(path):
+            if not isinstance(row, dict):
+                self.errors.write(path, line, row, ["row is not a JSON object"])
+                continue
+
+            task_ref = row.get("task_ref")
+            if task_ref is not None:
+                task_id = self.refs.get(str(task_ref))
+                if task_id is None:
+                    self.errors.write(path, line, row, [f"task_ref: unknown task {task_ref!r}"])
+                    continue
+                row = {**row, "task_id": task_id}
+            try:
+                reminder = ReminderImport.model_validate(row)
+            except ValidationError as e:
+                self.errors.write(path, line, row, _error_messages(e))
+                continue
+
+            chunk.append((line, row, reminder))
+            if len(chunk) >= self.chunk_size:
+                await self._load_reminders(path, chunk)
+                chunk = []
+        if chunk:
+            await self._load_reminders(path, chunk)
+
+    async def _load_tasks(self, path: Path, chunk: list) -> None:
+        now = datetime.now(timezone.utc)
+        task_records, reminder_records, reminder_sources = [], [], []
+        for line, row, task_id, task, reminders in chunk:
+            created_at = task.created_at or now
+            task_records.append((
+                task_id, task.title, task.description, task.status.name,
+                task.due_time, task.source.name, created_at, created_at
+            ))
+            for index, reminder in enumerate(reminders):
+                reminder_records.append(self._reminder_record(reminder, created_at))
+                reminder_sources.append((line, row["reminders"][index]))
+
+        try:
+            async with self.pg.transaction():
+                await self.pg.copy_records_to_table("tasks", records=task_records, columns=TASK_COLUMNS)
+                inserted = await self._insert_reminders(path, reminder_records, reminder_sources)
+        except asyncpg.PostgresError as e:
+            for line, row, *_ in chunk:
+                self.errors.write(path, line, row, [f"database: {e}"])
+            return
+
+        self.tasks += len(task_records)
+        self.reminders += inserted
+        if self.keep_refs:
+            self.refs.update((str(task.ref), task_id) for _, _, task_id, task, _ in chunk if task.ref is not None)
+        self._progress()
+
+    async def _load_reminders(self, path: Path, chunk: list) -> None:
+        task_ids = list({reminder.task_id for _, _, reminder in chunk})
+        existing = {
+            record["id"]
+            for record in await self.pg.fetch("SELECT id FROM tasks WHERE id = ANY($1::uuid[])", task_ids)
+        }
+
+        now = datetime.now(timezone.utc)
+        records, sources = [], []
+        for line, row, reminder in chunk:
+            if reminder.task_id not in existing:
+                self.errors.write(path, line, row, [f"task_id: task {reminder.task_id} not found"])
+                continue
+            records.append(self._reminder_record(reminder, now))
+            sources.append((line, row))
+
+        try:
+            async with self.pg.transaction():
+                inserted = await self._insert_reminders(path, records, sources)
+        except asyncpg.PostgresError as e:
+            for line, row in sources:
+                self.errors.write(path, line, row, [f"database: {e}"])
+            return
+
+        self.reminders += inserted
+        self._progress()
+
+    @staticmethod
+    def _reminder_record(reminder: ReminderImport, created_at: datetime) -> tuple:
+        return (
+            uuid.uuid4(), reminder.task_id, reminder.remind_at, reminder.channel.name,
+            reminder.sent, reminder.repeat_interval, reminder.repeat_until, created_at
+        )
+
+    async def _insert_reminders(self, path: Path, records: list[tuple], sources: list[tuple[int, Any]]) -> int:
+        """COPY reminders into the staging table and move the new ones over."""
+        if not records:
+            return 0
+        await self.pg.copy_records_to_table("reminders_import", records=records, columns=REMINDER_COLUMNS)
+        inserted = {record["id"] for record in await self.pg.fetch(_INSERT_STAGED)}
+
+        for record, (line, row) in zip(records, sources):
+            if record[0] not in inserted:
+                self.errors.write(path, line, row, ["duplicate reminder (task_id, remind_at, channel)"])
+        self.duplicates += len(records) - len(inserted)
+        return len(inserted)
+
+    def _progress(self) -> None:
+        print(f"  {self.tasks:,} tasks, {self.reminders:,} reminders, {self.errors.count:,} rejected", flush=True)
+
+
+async def run_import(
+    tasks_path: Path | None,
+    reminders_path: Path | None,
+    errors_path: Path,
+    chunk_size: int
+) -> dict[str, Any]:
+    """
+    Import the given files and return counts and throughput.
+
+    Args:
+        tasks_path: Optional tasks file
+        reminders_path: Optional reminders file
+        errors_path: Where rejected rows are written
+        chunk_size: Rows per COPY
+
+    Returns:
+        Loaded, duplicate and rejected row counts, elapsed time and rows/s
+    """
+    errors = ErrorFile(errors_path)
+    start = time.perf_counter()
+
+    try:
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            pg = raw.driver_connection
+            await pg.execute(_CREATE_STAGING)
+
+            importer = BulkImporter(pg, errors, chunk_size, keep_refs=reminders_path is not None)
+            if tasks_path is not None:
+                await importer.import_tasks(tasks_path)
+            if reminders_path is not None:
+                await importer.import_reminders(reminders_path)
+
+            await pg.execute("ANALYZE tasks")
+            await pg.execute("ANALYZE reminders")
+    finally:
+        errors.close()
+        await engine.dispose()
+
+    elapsed = time.perf_counter() - start
+    loaded = importer.tasks + importer.reminders
+    return {
+        "tasks": importer.tasks,
+        "reminders": importer.reminders,
+        "duplicates": importer.duplicates,
+        "rejected": errors.count,
+        "elapsed_s": round(elapsed, 2),
+        "rows_per_s": round(loaded / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk import tasks and reminders via COPY")
+    parser.add_argument("tasks", nargs="?", type=Path, help="Tasks file (.ndjson, .jsonl or .csv)")
+    parser.add_argument("--reminders", type=Path, help="Reminders file (.ndjson, .jsonl or .csv)")
+    parser.add_argument("--errors", type=Path, help="Rejected rows file (default: <input>.errors.ndjson)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows per COPY transaction")
+    args = parser.parse_args()
+
+    if args.tasks is None and args.reminders is None:
+        parser.error("give a tasks file, a --reminders file, or both")
+    source = args.tasks or args.reminders
+    errors_path = args.errors or source.with_name(f"{source.stem}.errors.ndjson")
+
+    results = asyncio.run(run_import(args.tasks, args.reminders, errors_path, args.chunk_size))
+    print(
+        f"Imported {results['tasks']:,} tasks and {results['reminders']:,} reminders "
+        f"in {results['elapsed_s']}s ({results['rows_per_s']:,} rows/s); "
+        f"{results['duplicates']:,} duplicate reminders skipped, {results['rejected']:,} rows rejected"
+        + (f" -> {errors_path}" if results["rejected"] else "")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Load and benchmark suite
@@ -0,0 +1,91 @@
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted sequence.
+
+    Args:
+        sorted_values: Values sorted ascending
+        pct: Percentile in the range 0-100
+
+    Returns:
+        Percentile value, or 0.0 for an empty sequence
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def latency_summary(latencies: Sequence[float], elapsed: float, errors: int = 0) -> dict[str, Any]:
+    """
+    Summarize request latencies (seconds) into a JSON-friendly dict.
+
+    Args:
+        latencies: Per-request latencies in seconds
+        elapsed: Wall-clock duration of the run in seconds
+        errors: Number of failed requests
+
+    Returns:
+        Count, error count, requests per second and p50/p95/p99/max in ms
+    """
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(
+    benchmark: str,
+    config: dict[str, Any],
+    results: dict[str, Any],
+    output: str | None = None
+) -> Path:
+    """
+    Write a machine-readable result file.
+
+    Args:
+        benchmark: Benchmark name (seed, load, scheduler)
+        config: Parameters the run was started with
+        results: Measured values
+        output: Optional output path; defaults to benchmarks/results/<name>-<timestamp>.json
+
+    Returns:
+        Path of the written file
+    """
+    now = datetime.now(timezone.utc)
+    path = Path(output) if output else RESULTS_DIR / f"{benchmark}-{now:%Y%m%dT%H%M%SZ}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "benchmark": benchmark,
+        "timestamp": now.isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "config": config,
+        "results": results,
+    }, indent=2, default=str))
+    return path
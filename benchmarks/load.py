@@ -0,0 +1,304 @@
+"""
+Async HTTP load driver.
+
+Drives a weighted mix of requests against every /tasks and /reminders
+route of a running server and reports per-route p50/p95/p99 latency and
+requests per second:
+
+    python -m benchmarks.load --base-url http://localhost:8000 \
+        --concurrency 32 --duration 60
+
+Routes are discovered from the server's OpenAPI schema; any route
+without a scenario below is reported as uncovered.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+import httpx
+
+from benchmarks.common import latency_summary, write_results
+
+ROUTE_PREFIXES = ("/tasks", "/reminders")
+STATUSES = ["pending", "completed", "cancelled"]
+SOURCES = ["telegram", "whatsapp", "ui", "system"]
+CHANNELS = ["telegram", "whatsapp", "ui"]
+# Match the tasks created by task_payload, from few to many hits
+SEARCH_QUERIES = ["load", "created benchmarks", '"load test"', "test -benchmarks"]
+
+
+class LoadState:
+    """IDs shared between scenarios while the run is in progress."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.task_ids: list[str] = []
+        self.disposable_task_ids: deque[str] = deque()
+        self.disposable_reminder_ids: deque[str] = deque()
+        self.next_cursor: str | None = None
+
+    def task_id(self) -> str:
+        return self.rng.choice(self.task_ids)
+
+    def task_payload(self) -> dict:
+        return {
+            "title": f"load test {uuid.uuid4().hex[:8]}",
+            "description": "created by benchmarks.load",
+            "status": "pending",
+            "due_time": (datetime.now(timezone.utc) + timedelta(hours=self.rng.randint(1, 720))).isoformat(),
+            "source": self.rng.choice(SOURCES),
+        }
+
+    def reminder_payload(self) -> dict:
+        # Far-future times so the scheduler does not pick them up mid-run
+        remind_at = datetime(2100, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=self.rng.randint(0, 10**9))
+        return {"task_id": self.task_id(), "remind_at": remind_at.isoformat(), "channel": self.rng.choice(CHANNELS)}
+
+
+Scenario = Callable[[httpx.AsyncClient, LoadState], Awaitable[httpx.Response]]
+
+
+async def _disposable_id(
+    ids: deque[str],
+    create: Scenario,
+    client: httpx.AsyncClient,
+    state: LoadState
+) -> str:
+    """Pop an ID for a delete scenario, creating a row first if none is left."""
+    if not ids:
+        await create(client, state)
+    if not ids:
+        # The create failed, or another worker took the new ID meanwhile;
+        # counted as an error of the delete route
+        raise httpx.HTTPError("No disposable row left to delete")
+    return ids.popleft()
+
+
+async def _create_task(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    response = await client.post("/tasks/", json=state.task_payload())
+    if response.status_code == 201:
+        state.disposable_task_ids.append(response.json()["id"])
+    return response
+
+
+async def _list_tasks(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    params = {"limit": 100}
+    roll = state.rng.random()
+    if roll < 0.4:
+        params["status"] = state.rng.choice(STATUSES)
+        if state.rng.random() < 0.2:
+            params["include_archived"] = "true"
+    elif roll < 0.6:
+        # Agent queries: overdue tasks, or pending tasks due within the next hour
+        params["sort"] = "due_time"
+        if state.rng.random() < 0.5:
+            params["overdue"] = "true"
+        else:
+            now = datetime.now(timezone.utc)
+            params.update(
+                status="pending",
+                due_after=now.isoformat(),
+                due_before=(now + timedelta(hours=1)).isoformat()
+            )
+    elif state.next_cursor:
+        params["after"] = state.next_cursor
+    if state.rng.random() < 0.2:
+        params["include"] = "reminders"
+    response = await client.get("/tasks/", params=params)
+    if "sort" not in params:
+        # Cursors only continue lists in the sort order that issued them
+        state.next_cursor = response.headers.get("X-Next-Cursor")
+    return response
+
+
+async def _get_task(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    params = {"include": "reminders"} if state.rng.random() < 0.2 else {}
+    return await client.get(f"/tasks/{state.task_id()}", params=params)
+
+
+async def _update_task(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    return await client.patch(f"/tasks/{state.task_id()}", json={"status": state.rng.choice(STATUSES)})
+
+
+async def _delete_task(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    task_id = await _disposable_id(state.disposable_task_ids, _create_task, client, state)
+    return await client.delete(f"/tasks/{task_id}")
+
+
+async def _create_tasks_bulk(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    return await client.post("/tasks/bulk", json=[state.task_payload() for _ in range(100)])
+
+
+async def _batch_get_tasks(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    ids = state.rng.sample(state.task_ids, min(50, len(state.task_ids))) + [str(uuid.uuid4())]
+    return await client.post("/tasks/batch-get", json={"ids": ids})
+
+
+async def _export_tasks(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    # Recent tasks only, so one export stays comparable to the other requests
+    since = datetime.now(timezone.utc) - timedelta(minutes=5)
+    return await client.get("/tasks/export", params={"created_after": since.isoformat()})
+
+
+async def _search_tasks(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    params = {"q": state.rng.choice(SEARCH_QUERIES), "limit": 20}
+    if state.rng.random() < 0.3:
+        params["status"] = state.rng.choice(STATUSES)
+    return await client.get("/tasks/search", params=params)
+
+
+async def _task_stats(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    return await client.get("/tasks/stats")
+
+
+async def _create_reminder(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    response = await client.post("/reminders/", json=state.reminder_payload())
+    if response.status_code == 201:
+        state.disposable_reminder_ids.append(response.json()["id"])
+    return response
+
+
+async def _create_reminders_bulk(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    return await client.post("/reminders/bulk", json=[state.reminder_payload() for _ in range(100)])
+
+
+async def _list_reminders(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    params = {"limit": 100}
+    if state.rng.random() < 0.5:
+        params["task_id"] = state.task_id()
+        if state.rng.random() < 0.2:
+            params["include_archived"] = "true"
+    else:
+        params["sent"] = "false"
+    return await client.get("/reminders/", params=params)
+
+
+async def _batch_get_reminders(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    ids = list(state.disposable_reminder_ids)[-50:] + [str(uuid.uuid4())]
+    return await client.post("/reminders/batch-get", json={"ids": ids})
+
+
+async def _export_reminders(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    return await client.get("/reminders/export", params={"task_id": state.task_id()})
+
+
+async def _delete_reminder(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    reminder_id = await _disposable_id(state.disposable_reminder_ids, _create_reminder, client, state)
+    return await client.delete(f"/reminders/{reminder_id}")
+
+
+# (method, route template) -> (weight, scenario)
+SCENARIOS: dict[tuple[str, str], tuple[int, Scenario]] = {
+    ("POST", "/tasks/"): (10, _create_task),
+    ("GET", "/tasks/"): (20, _list_tasks),
+    ("GET", "/tasks/{task_id}"): (30, _get_task),
+    ("PATCH", "/tasks/{task_id}"): (8, _update_task),
+    ("DELETE", "/tasks/{task_id}"): (3, _delete_task),
+    ("POST", "/tasks/bulk"): (1, _create_tasks_bulk),
+    ("GET", "/tasks/export"): (1, _export_tasks),
+    ("GET", "/tasks/stats"): (3, _task_stats),
+    ("GET", "/tasks/search"): (5, _search_tasks),
+    ("POST", "/tasks/batch-get"): (3, _batch_get_tasks),
+    ("POST", "/reminders/"): (8, _create_reminder),
+    ("POST", "/reminders/bulk"): (1, _create_reminders_bulk),
+    ("GET", "/reminders/"): (15, _list_reminders),
+    ("DELETE", "/reminders/{reminder_id}"): (3, _delete_reminder),
+    ("GET", "/reminders/export"): (1, _export_reminders),
+    ("POST", "/reminders/batch-get"): (2, _batch_get_reminders),
+}
+
+
+async def discover_routes(client: httpx.AsyncClient) -> set[tuple[str, str]]:
+    """Return the (method, path) pairs of the API routers from /openapi.json."""
+    schema = (await client.get("/openapi.json")).json()
+    return {
+        (method.upper(), path)
+        for path, operations in schema["paths"].items()
+        if path.startswith(ROUTE_PREFIXES)
+        for method in operations
+    }
+
+
+async def run(base_url: str, concurrency: int, duration: float, warmup_tasks: int, seed_value: int) -> dict:
+    """Run the load test and return per-route and overall results."""
+    state = LoadState(random.Random(seed_value))
+    latencies: dict[tuple[str, str], list[float]] = {key: [] for key in SCENARIOS}
+    errors: dict[tuple[str, str], int] = {key: 0 for key in SCENARIOS}
+    keys = list(SCENARIOS)
+    weights = [SCENARIOS[key][0] for key in keys]
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        routes = await discover_routes(client)
+        uncovered = sorted(f"{method} {path}" for method, path in routes - set(SCENARIOS))
+
+        # Working set of tasks the read and update scenarios pick from
+        response = await client.post("/tasks/bulk", json=[state.task_payload() for _ in range(warmup_tasks)])
+        response.raise_for_status()
+        state.task_ids = [item["task"]["id"] for item in response.json()["items"]]
+
+        async def timed(key: tuple[str, str]) -> None:
+            start = time.perf_counter()
+            try:
+                response = await SCENARIOS[key][1](client, state)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies[key].append(time.perf_counter() - start)
+            if failed:
+                errors[key] += 1
+
+        # Hit every route at least once, then run the weighted mix
+        for key in keys:
+            await timed(key)
+
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await timed(state.rng.choices(keys, weights=weights)[0])
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "overall": latency_summary(all_latencies, elapsed, sum(errors.values())),
+        "routes": {
+            f"{method} {path}": latency_summary(latencies[(method, path)], elapsed, errors[(method, path)])
+            for method, path in keys
+        },
+        "uncovered_routes": uncovered,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP load test for the OpenClaw API")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds of steady-state load")
+    parser.add_argument("--warmup-tasks", type=int, default=1000, help="Tasks created before the run")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Result file path")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.base_url, args.concurrency, args.duration, args.warmup_tasks, args.seed))
+    path = write_results("load", vars(args), results, args.output)
+
+    print(f"{'route':<36} {'req':>8} {'err':>6} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for name, summary in [*results["routes"].items(), ("overall", results["overall"])]:
+        print(f"{name:<36} {summary['requests']:>8} {summary['errors']:>6} {summary['rps']:>9} "
+              f"{summary['p50_ms']:>8}ms {summary['p95_ms']:>8}ms {summary['p99_ms']:>8}ms")
+    if results["uncovered_routes"]:
+        print(f"WARNING: routes without a scenario: {', '.join(results['uncovered_routes'])}")
+    print(f"Results -> {path}")
+
+
+if __name__ == "__main__":
+    main()
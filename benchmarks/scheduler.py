@@ -0,0 +1,148 @@
+"""
+Reminder dispatch benchmark.
+
+Loads N due reminders spread over the channels, then drains them with
+one or more ReminderSchedulerService instances using StubSender
+dispatchers, and reports reminders dispatched per second:
+
+    DATABASE_URL=postgresql+asyncpg://... DB_SSL= \
+        python -m benchmarks.scheduler --reminders 50000 --instances 4
+
+Instances share the event loop and connection pool but claim batches
+independently, like separate workers would. The benchmark's rows are
+deleted afterwards; run it against a database with no other due,
+unsent reminders, as those would be dispatched too.
+"""
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.reminder import Reminder, ReminderChannel
+from app.models.task import Task, TaskSource, TaskStatus
+from app.services.notifications import ChannelDispatcher, StubSender
+from app.services.scheduler import ReminderSchedulerService
+from benchmarks.common import write_results
+
+TASK_TITLE = "benchmarks.scheduler"
+REMINDERS_PER_TASK = 100
+
+
+async def load_reminders(count: int) -> list[uuid.UUID]:
+    """Insert ``count`` due reminders via COPY and return their task IDs."""
+    now = datetime.now(timezone.utc)
+    channels = list(ReminderChannel)
+    task_ids = [uuid.uuid4() for _ in range(-(-count // REMINDERS_PER_TASK))]
+    tasks = [
+        (task_id, TASK_TITLE, TaskStatus.PENDING.name, TaskSource.SYSTEM.name, now, now)
+        for task_id in task_ids
+    ]
+    reminders = [
+        (
+            uuid.uuid4(),
+            task_ids[i // REMINDERS_PER_TASK],
+            now - timedelta(seconds=i + 1),
+            channels[i % len(channels)].name,
+            False,
+            now,
+        )
+        for i in range(count)
+    ]
+
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        pg = raw.driver_connection
+        async with pg.transaction():
+            await pg.copy_records_to_table(
+                "tasks", records=tasks,
+                columns=["id", "title", "status", "source", "created_at", "updated_at"]
+            )
+            await pg.copy_records_to_table(
+                "reminders", records=reminders,
+                columns=["id", "task_id", "remind_at", "channel", "sent", "created_at"]
+            )
+        await pg.execute("ANALYZE reminders")
+    return task_ids
+
+
+async def benchmark(
+    reminder_count: int,
+    instances: int,
+    batch_size: int,
+    latency_ms: float,
+    workers_per_channel: int,
+    rate_limit: float
+) -> dict:
+    """Load, drain and clean up; return throughput figures."""
+    task_ids = await load_reminders(reminder_count)
+    services = [
+        ReminderSchedulerService(
+            batch_size=batch_size,
+            dispatchers={
+                channel: ChannelDispatcher(
+                    sender=StubSender(latency=latency_ms / 1000),
+                    rate_limit=rate_limit,
+                    workers=workers_per_channel
+                )
+                for channel in ReminderChannel
+            }
+        )
+        for _ in range(instances)
+    ]
+
+    try:
+        start = time.perf_counter()
+        delivered = await asyncio.gather(*(service.process_pending_reminders() for service in services))
+        elapsed = time.perf_counter() - start
+
+        async with AsyncSessionLocal() as db:
+            unsent = await db.scalar(
+                select(func.count()).select_from(Reminder).where(
+                    Reminder.task_id.in_(task_ids),
+                    Reminder.sent.is_(False)
+                )
+            )
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(Task).where(Task.id.in_(task_ids)))
+            await db.commit()
+        await engine.dispose()
+
+    total = sum(delivered)
+    return {
+        "dispatched": total,
+        "per_instance": delivered,
+        "left_unsent": unsent,
+        "elapsed_s": round(elapsed, 3),
+        "reminders_per_s": round(total / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reminder dispatch throughput benchmark")
+    parser.add_argument("--reminders", type=int, default=20_000, help="Due reminders to load")
+    parser.add_argument("--instances", type=int, default=1, help="Concurrent scheduler instances")
+    parser.add_argument("--batch-size", type=int, default=100, help="Reminders claimed per batch")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated send latency")
+    parser.add_argument("--workers-per-channel", type=int, default=8)
+    parser.add_argument("--rate-limit", type=float, default=1_000_000.0, help="Per-channel sends per second, per instance")
+    parser.add_argument("--output", help="Result file path")
+    args = parser.parse_args()
+
+    logging.getLogger("app").setLevel(logging.WARNING)
+    results = asyncio.run(benchmark(
+        args.reminders, args.instances, args.batch_size,
+        args.latency_ms, args.workers_per_channel, args.rate_limit
+    ))
+    path = write_results("scheduler", vars(args), results, args.output)
+    print(f"Dispatched {results['dispatched']:,} reminders in {results['elapsed_s']}s "
+          f"({results['reminders_per_s']:,}/s, {results['left_unsent']} left unsent) -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Seed generator for benchmarks.
+
+Loads N tasks and their reminders with realistic distributions through
+Postgres COPY. Run against a local database only:
+
+    DATABASE_URL=postgresql+asyncpg://... DB_SSL= \
+        python -m benchmarks.seed --tasks 1000000 --truncate
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.models.reminder import ReminderChannel
+from app.models.task import TaskSource, TaskStatus
+from benchmarks.common import write_results
+
+TASK_COLUMNS = ["id", "title", "description", "status", "due_time", "source", "created_at", "updated_at"]
+REMINDER_COLUMNS = ["id", "task_id", "remind_at", "channel", "sent", "created_at"]
+
+# Enum columns are stored by member name (native_enum=False)
+STATUS_WEIGHTS = {TaskStatus.PENDING: 60, TaskStatus.COMPLETED: 32, TaskStatus.CANCELLED: 8}
+SOURCE_WEIGHTS = {TaskSource.TELEGRAM: 45, TaskSource.WHATSAPP: 35, TaskSource.UI: 15, TaskSource.SYSTEM: 5}
+CHANNEL_WEIGHTS = {ReminderChannel.TELEGRAM: 50, ReminderChannel.WHATSAPP: 40, ReminderChannel.UI: 10}
+# Number of reminders per task: most have none or one
+REMINDER_COUNT_WEIGHTS = {0: 35, 1: 40, 2: 15, 3: 7, 5: 3}
+
+WORDS = (
+    "call email buy review pay book renew send check update plan fix "
+    "clean prepare submit schedule order pick confirm cancel"
+).split()
+OBJECTS = (
+    "invoice report groceries tickets dentist car insurance meeting "
+    "slides rent passport flight gym parcel contract"
+).split()
+
+
+def _weighted(rng: random.Random, weights: dict, k: int) -> list:
+    return rng.choices(list(weights), weights=list(weights.values()), k=k)
+
+
+def generate_chunk(
+    rng: random.Random,
+    size: int,
+    now: datetime
+) -> tuple[list[tuple], list[tuple]]:
+    """
+    Generate one chunk of task and reminder records.
+
+    Tasks are created over the past year; pending tasks are mostly due
+    within the next month, finished ones in the past. Reminders fall
+    before the due time and are marked sent when already past.
+
+    Args:
+        rng: Random generator
+        size: Number of tasks in the chunk
+        now: Reference time
+
+    Returns:
+        Task records and reminder records, in COPY column order
+    """
+    tasks, reminders = [], []
+    statuses = _weighted(rng, STATUS_WEIGHTS, size)
+    sources = _weighted(rng, SOURCE_WEIGHTS, size)
+    reminder_counts = _weighted(rng, REMINDER_COUNT_WEIGHTS, size)
+
+    for status, source, reminder_count in zip(statuses, sources, reminder_counts):
+        task_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+        created_at = now - timedelta(seconds=rng.randint(0, 365 * 86400))
+        if rng.random() < 0.3:
+            due_time = None
+        elif status == TaskStatus.PENDING:
+            due_time = now + timedelta(seconds=rng.randint(-3 * 86400, 30 * 86400))
+        else:
+            due_time = created_at + timedelta(seconds=rng.randint(3600, 14 * 86400))
+        title = f"{rng.choice(WORDS).capitalize()} {rng.choice(OBJECTS)}"
+        description = f"{title} before {due_time:%Y-%m-%d}" if due_time and rng.random() < 0.5 else None
+        updated_at = created_at if status == TaskStatus.PENDING else created_at + timedelta(hours=rng.randint(1, 240))
+        tasks.append((task_id, title, description, status.name, due_time, source.name, created_at, updated_at))
+
+        remind_at = (due_time or created_at + timedelta(days=1)) - timedelta(minutes=15)
+        for _ in range(reminder_count):
+            channel = _weighted(rng, CHANNEL_WEIGHTS, 1)[0]
+            reminders.append((uuid.UUID(int=rng.getrandbits(128), version=4), task_id, remind_at, channel.name, remind_at <= now, created_at))
+            remind_at -= timedelta(hours=rng.randint(1, 24))
+
+    return tasks, reminders
+
+
+def _chunks(total: int, chunk_size: int) -> Iterator[int]:
+    while total > 0:
+        yield min(chunk_size, total)
+        total -= chunk_size
+
+
+async def seed(task_count: int, chunk_size: int, truncate: bool, seed_value: int) -> dict:
+    """Load the data set and return counts and throughput."""
+    rng = random.Random(seed_value)
+    now = datetime.now(timezone.utc)
+    loaded_tasks = loaded_reminders = 0
+    start = time.perf_counter()
+
+    async with engine.connect() as conn:
+        if truncate:
+            await conn.execute(text("TRUNCATE reminders, tasks"))
+            await conn.commit()
+        raw = await conn.get_raw_connection()
+        pg = raw.driver_connection
+
+        for size in _chunks(task_count, chunk_size):
+            tasks, reminders = generate_chunk(rng, size, now)
+            async with pg.transaction():
+                await pg.copy_records_to_table("tasks", records=tasks, columns=TASK_COLUMNS)
+                await pg.copy_records_to_table("reminders", records=reminders, columns=REMINDER_COLUMNS)
+            loaded_tasks += len(tasks)
+            loaded_reminders += len(reminders)
+            print(f"  {loaded_tasks:,} tasks, {loaded_reminders:,} reminders", flush=True)
+
+        await pg.execute("ANALYZE tasks")
+        await pg.execute("ANALYZE reminders")
+
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return {
+        "tasks": loaded_tasks,
+        "reminders": loaded_reminders,
+        "elapsed_s": round(elapsed, 2),
+        "rows_per_s": round((loaded_tasks + loaded_reminders) / elapsed, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed tasks and reminders for benchmarks")
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="Number of tasks to load")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Tasks per COPY transaction")
+    parser.add_argument("--truncate", action="store_true", help="Empty the tables first")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Result file path")
+    args = parser.parse_args()
+
+    results = asyncio.run(seed(args.tasks, args.chunk_size, args.truncate, args.seed))
+    path = write_results("seed", vars(args), results, args.output)
+    print(f"Seeded {results['tasks']:,} tasks and {results['reminders']:,} reminders "
+          f"at {results['rows_per_s']:,} rows/s -> {path}")
+
+
+if __name__ == "__main__":
+    main()